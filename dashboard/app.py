@@ -5,13 +5,12 @@ Streamlit을 활용한 실시간 가격 비교 및 시각화
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import json
+import numpy as np
+import orjson
 import logging
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
 import sys
 
 # 프로젝트 루트 경로 추가
@@ -19,6 +18,9 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from naver_api.product_monitor import ProductMonitor
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -58,34 +60,146 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def load_latest_results(results_dir: str = "results") -> dict:
-    """최신 모니터링 결과를 로드합니다."""
-    results_path = Path(results_dir)
-    if not results_path.exists():
-        return None
-    
+# 타임스탬프/mtime이 키에 들어가는 캐시는 실행마다 항목이 늘어나므로 최근 항목만 유지
+CACHE_MAX_ENTRIES = 8
+
+# 리셀러 테이블 컬럼 설정 (포맷팅은 브라우저 그리드에서 처리)
+TABLE_COLUMN_CONFIG = {
+    'product_name': st.column_config.TextColumn('제품명'),
+    'mall_name': st.column_config.TextColumn('쇼핑몰'),
+    'price': st.column_config.NumberColumn('가격', format='%d원'),
+    'original_price': st.column_config.NumberColumn('정가', format='%d원'),
+    'discount_rate': st.column_config.NumberColumn('할인율', format='%.1f%%'),
+    'discount_amount': st.column_config.NumberColumn('할인금액', format='%d원'),
+    'title': st.column_config.TextColumn('상품명'),
+    'product_link': st.column_config.LinkColumn('링크', display_text='바로가기')
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _scan_latest_file(results_dir: str, dir_mtime: float) -> Optional[str]:
+    """
+    결과 디렉터리를 스캔해 가장 최신 결과 파일 경로를 반환합니다.
+    디렉터리 mtime이 캐시 키이므로 새 파일이 생길 때만 다시 스캔합니다.
+    """
     # JSON 파일 중 가장 최신 파일 찾기
-    json_files = list(results_path.glob("monitoring_results_*.json"))
+    json_files = list(Path(results_dir).glob("monitoring_results_*.json"))
     if not json_files:
         return None
-    
-    latest_file = max(json_files, key=lambda x: x.stat().st_mtime)
-    
+
+    return str(max(json_files, key=lambda x: x.stat().st_mtime))
+
+
+def _find_latest_path(results_dir: str = "results") -> Optional[Tuple[str, float]]:
+    """가장 최신 결과 파일의 경로와 수정 시각을 반환합니다."""
+    try:
+        dir_mtime = Path(results_dir).stat().st_mtime
+    except OSError:
+        return None
+
+    latest_file = _scan_latest_file(results_dir, dir_mtime)
+    if latest_file is None:
+        return None
+
+    try:
+        return latest_file, Path(latest_file).stat().st_mtime
+    except OSError:
+        # 스캔 이후 파일이 삭제된 경우 다시 스캔
+        _scan_latest_file.clear()
+        return None
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _load_json(path: str, mtime: float) -> dict:
+    """결과 파일을 파싱합니다. (path, mtime)이 캐시 키이므로 파일이 갱신되면 다시 읽습니다."""
+    return orjson.loads(Path(path).read_bytes())
+
+
+def load_latest_results(results_dir: str = "results") -> Tuple[Optional[str], Optional[dict]]:
+    """
+    최신 모니터링 결과를 로드합니다.
+    경로와 결과를 한 번의 스캔으로 함께 반환하므로 두 값이 항상 같은 실행을 가리킵니다.
+
+    Returns:
+        Tuple[Optional[str], Optional[dict]]: (결과 파일 경로, 결과)
+    """
+    latest = _find_latest_path(results_dir)
+    if latest is None:
+        return None, None
+
     try:
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return latest[0], _load_json(*latest)
     except Exception as e:
         st.error(f"결과 파일 로드 실패: {e}")
-        return None
+        return latest[0], None
+
+
+def _reseller_data_path(results_path: str) -> Path:
+    """결과 JSON 파일과 같은 시각에 저장된 리셀러 Parquet 파일 경로를 반환합니다."""
+    path = Path(results_path)
+    return path.with_name(path.name.replace('monitoring_results_', 'reseller_data_', 1)).with_suffix('.parquet')
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _load_parquet(path: str, mtime: float) -> pd.DataFrame:
+    """리셀러 Parquet 파일을 읽습니다. (path, mtime)이 캐시 키입니다."""
+    return pd.read_parquet(path)
+
+
+def load_reseller_dataframe(results: dict, results_path: Optional[str]) -> pd.DataFrame:
+    """
+    리셀러 DataFrame을 로드합니다.
+    결과와 함께 저장된 Parquet 파일이 있으면 JSON 결과를 펼치지 않고 바로 읽습니다.
+    """
+    if results_path:
+        parquet_path = _reseller_data_path(results_path)
+        try:
+            return _load_parquet(str(parquet_path), parquet_path.stat().st_mtime)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Parquet 파일 로드 실패, JSON 결과를 사용합니다: {e}")
+    
+    return get_monitor().get_dataframe(results)
+
+
+# ProductMonitor가 읽는 제품 설정 파일
+PRODUCT_CONFIG_PATH = Path("data/product_config.json")
+
+
+@st.cache_resource(max_entries=1)
+def _get_monitor_for_config(config_path: str, config_mtime_ns: int) -> ProductMonitor:
+    """설정 파일 (경로, mtime)별 ProductMonitor를 만듭니다. 설정이 수정되면 이전 인스턴스는 버려집니다."""
+    return ProductMonitor(config_path)
 
 
-def create_price_comparison_chart(df: pd.DataFrame) -> go.Figure:
+def get_monitor() -> ProductMonitor:
+    """프로세스 전체에서 공유하는 ProductMonitor 인스턴스를 반환합니다. 설정 파일이 수정되면 새로 만듭니다."""
+    try:
+        config_mtime_ns = PRODUCT_CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        # 설정 파일이 없으면 ProductMonitor가 로드 오류를 보고
+        config_mtime_ns = 0
+    return _get_monitor_for_config(str(PRODUCT_CONFIG_PATH), config_mtime_ns)
+
+
+def _group_color(df: pd.DataFrame) -> Optional[str]:
+    """
+    제품이 두 개 이상일 때만 제품별 색상 구분 컬럼을 반환합니다.
+    단일 제품이면 plotly express의 그룹별 trace 분할을 생략합니다.
+    """
+    return 'product_name' if df['product_name'].nunique() > 1 else None
+
+
+def create_price_comparison_chart(df: pd.DataFrame) -> "go.Figure":
     """가격 비교 차트를 생성합니다."""
+    import plotly.express as px
+    
     fig = px.box(
         df, 
         x='product_name', 
         y='price',
-        color='product_name',
+        color=_group_color(df),
         title='제품별 가격 분포',
         labels={'price': '가격 (원)', 'product_name': '제품명'}
     )
@@ -98,18 +212,43 @@ def create_price_comparison_chart(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def create_discount_rate_chart(df: pd.DataFrame) -> go.Figure:
+def _binned_bar_traces(df: pd.DataFrame, column: str, bins: int,
+                       group_column: Optional[str] = None) -> list:
+    """
+    numpy로 미리 구간별 개수를 계산해 막대 trace 목록을 생성합니다.
+    원본 데이터 대신 구간별 개수만 Figure에 담기므로 페이로드가 구간 수에 비례합니다.
+    """
+    import plotly.graph_objects as go
+    
+    # 값이 없는 행은 px.histogram처럼 제외 (NaN이 있으면 구간 계산이 실패함)
+    edges = np.histogram_bin_edges(df[column].dropna().to_numpy(), bins=bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    width = edges[1] - edges[0]
+    
+    if group_column is None:
+        groups = [(None, df[column])]
+    else:
+        groups = df.groupby(group_column, observed=True, sort=True)[column]
+    
+    traces = []
+    for name, values in groups:
+        counts, _ = np.histogram(values.dropna().to_numpy(), bins=edges)
+        traces.append(go.Bar(x=centers, y=counts, width=width, name=name))
+    return traces
+
+
+def create_discount_rate_chart(df: pd.DataFrame) -> "go.Figure":
     """할인율 분포 차트를 생성합니다."""
-    fig = px.histogram(
-        df,
-        x='discount_rate',
-        color='product_name',
-        title='할인율 분포',
-        labels={'discount_rate': '할인율 (%)', 'product_name': '제품명'},
-        nbins=20
-    )
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(_binned_bar_traces(df, 'discount_rate', bins=20, group_column=_group_color(df)))
     
     fig.update_layout(
+        title='할인율 분포',
+        xaxis_title='할인율 (%)',
+        yaxis_title='count',
+        legend_title_text='제품명',
+        barmode='stack',
         height=400,
         showlegend=True
     )
@@ -117,21 +256,102 @@ def create_discount_rate_chart(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+def create_price_histogram(df: pd.DataFrame, product_name: str) -> "go.Figure":
+    """단일 제품의 가격 분포 히스토그램을 생성합니다."""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(_binned_bar_traces(df, 'price', bins=15))
+    
+    fig.update_layout(
+        title=f'{product_name} 가격 분포',
+        xaxis_title='가격 (원)',
+        yaxis_title='count'
+    )
+    
+    return fig
+
+
+def _column_bytes(df: pd.DataFrame, column: str) -> bytes:
+    """차트 캐시 키로 사용할 컬럼 값의 바이트 표현을 반환합니다."""
+    values = df[column].to_numpy()
+    if values.dtype == object:
+        values = values.astype(str)
+    return values.tobytes()
+
+
+# 차트 캐시: DataFrame 전체 대신 차트에 쓰이는 컬럼의 바이트만 해싱합니다.
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _price_comparison_figure(prices: bytes, names: bytes, _df: pd.DataFrame) -> dict:
+    """가격 비교 차트를 Figure dict로 생성합니다."""
+    return create_price_comparison_chart(_df).to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _discount_rate_figure(rates: bytes, names: bytes, _df: pd.DataFrame) -> dict:
+    """할인율 분포 차트를 Figure dict로 생성합니다."""
+    return create_discount_rate_chart(_df).to_dict()
+
+
 def create_top_resellers_table(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
     """최고 할인율 리셀러 테이블을 생성합니다."""
     if df.empty:
         return pd.DataFrame()
     
-    # 할인율 기준으로 정렬하여 상위 N개 선택
-    top_resellers = df.nlargest(top_n, 'discount_rate')
-    
     # 표시할 컬럼만 선택
     display_columns = [
         'product_name', 'mall_name', 'price', 'original_price', 
         'discount_rate', 'discount_amount', 'title', 'product_link'
     ]
     
-    return top_resellers[display_columns].copy()
+    # 할인율 기준으로 정렬하여 상위 N개 선택 (nlargest 결과가 이미 새 객체이므로 추가 복사 없음)
+    return df.nlargest(top_n, 'discount_rate').loc[:, display_columns]
+
+
+# 아래 캐시 함수들은 monitoring_timestamp를 결과 식별 키로 사용하고,
+# DataFrame 인자는 밑줄 접두사로 해싱 대상에서 제외합니다.
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def get_product_summary(results_ts: str, _df: pd.DataFrame) -> pd.DataFrame:
+    """제품별 요약 통계를 계산합니다."""
+    return _df.groupby('product_name', observed=True).agg({
+        'price': ['count', 'mean', 'min', 'max'],
+        'discount_rate': ['mean', 'min', 'max']
+    }).round(2)
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def get_top_resellers(results_ts: str, top_n: int, _df: pd.DataFrame) -> pd.DataFrame:
+    """최고 할인율 리셀러 테이블을 반환합니다."""
+    return create_top_resellers_table(_df, top_n)
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def get_filtered_data(results_ts: str, products: Tuple[str, ...], min_discount: int,
+                      _df: pd.DataFrame) -> pd.DataFrame:
+    """선택한 제품과 최소 할인율로 필터링한 데이터를 반환합니다."""
+    return _df[
+        (_df['product_name'].isin(products)) &
+        (_df['discount_rate'] >= min_discount)
+    ]
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def to_csv_bytes(results_ts: str, products: Tuple[str, ...], min_discount: int,
+                 _df: pd.DataFrame) -> bytes:
+    """필터링된 데이터를 CSV 바이트로 변환합니다. (같은 필터 조건이면 재사용)"""
+    return _df.to_csv(index=False).encode('utf-8-sig')
+
+
+def render_reseller_table(df: pd.DataFrame, columns: List[str]):
+    """
+    리셀러 테이블을 Arrow 기반 st.dataframe으로 렌더링합니다.
+    상품 링크는 LinkColumn으로 표시됩니다.
+    """
+    st.dataframe(
+        df[columns + ['product_link']],
+        column_config=TABLE_COLUMN_CONFIG,
+        hide_index=True,
+        use_container_width=True
+    )
 
 
 def main():
@@ -147,7 +367,7 @@ def main():
     if st.sidebar.button("🔄 실시간 모니터링 실행", type="primary"):
         with st.spinner("모니터링 중..."):
             try:
-                monitor = ProductMonitor()
+                monitor = get_monitor()
                 results = monitor.monitor_all_products()
                 
                 # 결과 저장
@@ -156,6 +376,7 @@ def main():
                 
                 # 세션 상태에 결과 저장
                 st.session_state.latest_results = results
+                st.session_state.results_path = output_path
                 st.session_state.monitoring_timestamp = datetime.now()
                 
             except Exception as e:
@@ -163,7 +384,7 @@ def main():
     
     # 최신 결과 로드
     if 'latest_results' not in st.session_state:
-        st.session_state.latest_results = load_latest_results()
+        st.session_state.results_path, st.session_state.latest_results = load_latest_results()
     
     # 결과가 없으면 안내 메시지
     if not st.session_state.latest_results:
@@ -187,9 +408,16 @@ def main():
     with col2:
         st.metric("🏪 발견된 리셀러 수", total_resellers)
     
-    # DataFrame 생성
-    monitor = ProductMonitor()
-    df = monitor.get_dataframe(st.session_state.latest_results)
+    # DataFrame 생성 (새 모니터링 결과가 들어왔을 때만 다시 만듦)
+    if st.session_state.get('df_ts') != monitoring_time or 'df' not in st.session_state:
+        df = load_reseller_dataframe(st.session_state.latest_results, st.session_state.results_path)
+        if not df.empty:
+            # 제품명을 범주형으로 변환 (선택/필터링이 범주 코드 비교로 처리됨, 등장 순서 유지)
+            df['product_name'] = pd.Categorical(df['product_name'], categories=pd.unique(df['product_name']))
+            st.session_state.product_choices = df['product_name'].cat.categories.tolist()
+        st.session_state.df = df
+        st.session_state.df_ts = monitoring_time
+    df = st.session_state.df
     
     if df.empty:
         st.warning("데이터가 없습니다.")
@@ -202,10 +430,7 @@ def main():
         st.subheader("📊 전체 현황")
         
         # 제품별 요약 통계
-        product_summary = df.groupby('product_name').agg({
-            'price': ['count', 'mean', 'min', 'max'],
-            'discount_rate': ['mean', 'min', 'max']
-        }).round(2)
+        product_summary = get_product_summary(monitoring_time, df)
         
         st.write("**제품별 요약 통계**")
         st.dataframe(product_summary, use_container_width=True)
@@ -213,12 +438,14 @@ def main():
         # 가격 분포 차트
         col1, col2 = st.columns(2)
         
+        product_names = _column_bytes(df, 'product_name')
+        
         with col1:
-            fig_price = create_price_comparison_chart(df)
+            fig_price = _price_comparison_figure(_column_bytes(df, 'price'), product_names, df)
             st.plotly_chart(fig_price, use_container_width=True)
         
         with col2:
-            fig_discount = create_discount_rate_chart(df)
+            fig_discount = _discount_rate_figure(_column_bytes(df, 'discount_rate'), product_names, df)
             st.plotly_chart(fig_discount, use_container_width=True)
     
     with tab2:
@@ -227,7 +454,7 @@ def main():
         # 제품별 선택
         selected_product = st.selectbox(
             "분석할 제품 선택",
-            df['product_name'].unique()
+            st.session_state.product_choices
         )
         
         if selected_product:
@@ -251,93 +478,30 @@ def main():
             
             with col2:
                 # 가격 분포 히스토그램
-                fig = px.histogram(
-                    product_df,
-                    x='price',
-                    title=f'{selected_product} 가격 분포',
-                    labels={'price': '가격 (원)'},
-                    nbins=15
-                )
+                fig = create_price_histogram(product_df, selected_product)
                 st.plotly_chart(fig, use_container_width=True)
             
             # 가격순 정렬된 리셀러 목록
             st.write(f"**{selected_product} 리셀러 목록 (가격순)**")
             
-            # 링크가 포함된 데이터프레임 생성
-            sorted_df = product_df.sort_values('price')[['mall_name', 'price', 'discount_rate', 'title', 'product_link']].copy()
-            
-            # 링크를 클릭 가능한 형태로 변환
-            def make_clickable_link(url, text):
-                if pd.isna(url) or url == '':
-                    return text
-                return f'<a href="{url}" target="_blank">{text}</a>'
-            
-            sorted_df['mall_name'] = sorted_df.apply(
-                lambda row: make_clickable_link(row['product_link'], row['mall_name']), axis=1
-            )
-            
-            # HTML로 렌더링
-            st.write(sorted_df[['mall_name', 'price', 'discount_rate', 'title']].to_html(
-                escape=False, 
-                index=False,
-                formatters={
-                    'price': '{:,.0f}원'.format,
-                    'discount_rate': '{:.1f}%'.format
-                }
-            ), unsafe_allow_html=True)
+            sorted_df = product_df.sort_values('price')
+            render_reseller_table(sorted_df, ['mall_name', 'price', 'discount_rate', 'title'])
     
     with tab3:
         st.subheader("🏆 최고 할인 리셀러")
         
         # 상위 할인율 리셀러
         top_n = st.slider("표시할 리셀러 수", 5, 20, 10)
-        top_resellers = create_top_resellers_table(df, top_n)
+        top_resellers = get_top_resellers(monitoring_time, top_n, df)
         
         if not top_resellers.empty:
             st.write(f"**상위 {top_n}개 최고 할인율 리셀러**")
             
-            # 할인율에 따른 색상 적용
-            def color_discount_rate(val):
-                if val >= 20:
-                    return 'background-color: #ffcdd2'  # 빨간색 (높은 할인)
-                elif val >= 10:
-                    return 'background-color: #fff3e0'  # 주황색 (중간 할인)
-                else:
-                    return 'background-color: #e8f5e8'  # 초록색 (낮은 할인)
-            
-            styled_df = top_resellers.style.applymap(
-                color_discount_rate, subset=['discount_rate']
-            ).format({
-                'price': '{:,.0f}원',
-                'original_price': '{:,.0f}원',
-                'discount_rate': '{:.1f}%',
-                'discount_amount': '{:,.0f}원'
-            })
-            
             # 링크가 포함된 최고 할인 리셀러 테이블
-            display_df = top_resellers[['product_name', 'mall_name', 'price', 'original_price', 'discount_rate', 'discount_amount', 'title', 'product_link']].copy()
-            
-            # 링크를 클릭 가능한 형태로 변환
-            def make_clickable_link(url, text):
-                if pd.isna(url) or url == '':
-                    return text
-                return f'<a href="{url}" target="_blank">{text}</a>'
-            
-            display_df['mall_name'] = display_df.apply(
-                lambda row: make_clickable_link(row['product_link'], row['mall_name']), axis=1
-            )
-            
-            # HTML로 렌더링
-            st.write(display_df[['product_name', 'mall_name', 'price', 'original_price', 'discount_rate', 'discount_amount', 'title']].to_html(
-                escape=False, 
-                index=False,
-                formatters={
-                    'price': '{:,.0f}원'.format,
-                    'original_price': '{:,.0f}원'.format,
-                    'discount_rate': '{:.1f}%'.format,
-                    'discount_amount': '{:,.0f}원'.format
-                }
-            ), unsafe_allow_html=True)
+            render_reseller_table(top_resellers, [
+                'product_name', 'mall_name', 'price', 'original_price',
+                'discount_rate', 'discount_amount', 'title'
+            ])
     
     with tab4:
         st.subheader("📋 상세 데이터")
@@ -348,53 +512,30 @@ def main():
         with col1:
             selected_products = st.multiselect(
                 "제품 선택",
-                df['product_name'].unique(),
-                default=df['product_name'].unique()
+                st.session_state.product_choices,
+                default=st.session_state.product_choices
             )
         
         with col2:
             min_discount = st.slider("최소 할인율 (%)", 0, 50, 0)
         
         # 필터링 적용
-        filtered_df = df[
-            (df['product_name'].isin(selected_products)) &
-            (df['discount_rate'] >= min_discount)
-        ].copy()
+        filter_key = (monitoring_time, tuple(selected_products), min_discount)
+        filtered_df = get_filtered_data(*filter_key, df)
         
         if not filtered_df.empty:
             st.write(f"**필터링된 결과: {len(filtered_df)}개**")
             
             # 다운로드 버튼
-            csv = filtered_df.to_csv(index=False, encoding='utf-8-sig')
             st.download_button(
                 label="📥 CSV 다운로드",
-                data=csv,
+                data=to_csv_bytes(*filter_key, filtered_df),
                 file_name=f"reseller_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv"
             )
             
             # 링크가 포함된 상세 데이터 테이블
-            display_df = filtered_df[['product_name', 'mall_name', 'price', 'discount_rate', 'title', 'product_link']].copy()
-            
-            # 링크를 클릭 가능한 형태로 변환
-            def make_clickable_link(url, text):
-                if pd.isna(url) or url == '':
-                    return text
-                return f'<a href="{url}" target="_blank">{text}</a>'
-            
-            display_df['mall_name'] = display_df.apply(
-                lambda row: make_clickable_link(row['product_link'], row['mall_name']), axis=1
-            )
-            
-            # HTML로 렌더링
-            st.write(display_df[['product_name', 'mall_name', 'price', 'discount_rate', 'title']].to_html(
-                escape=False, 
-                index=False,
-                formatters={
-                    'price': '{:,.0f}원'.format,
-                    'discount_rate': '{:.1f}%'.format
-                }
-            ), unsafe_allow_html=True)
+            render_reseller_table(filtered_df, ['product_name', 'mall_name', 'price', 'discount_rate', 'title'])
         else:
             st.warning("필터 조건에 맞는 데이터가 없습니다.")
 
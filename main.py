@@ -5,6 +5,8 @@
 """
 
 import sys
+import json
+import time
 import argparse
 import logging
 from typing import List, Dict, Any
@@ -43,6 +45,22 @@ class MultiPlatformMonitor:
             except Exception as e:
                 logger.error(f"스크래퍼 초기화 실패 ({platform}): {e}")
     
+    def close(self):
+        """모든 스크래퍼의 브라우저 컨텍스트를 닫습니다."""
+        for platform, scraper in self.scrapers.items():
+            try:
+                scraper.close()
+            except Exception as e:
+                logger.error(f"스크래퍼 종료 실패 ({platform}): {e}")
+    
+    def __enter__(self) -> "MultiPlatformMonitor":
+        """with 문에서 모니터링 시스템을 사용합니다."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """with 블록을 벗어나면 스크래퍼들을 닫습니다."""
+        self.close()
+    
     def detect_platform(self, url: str) -> str:
         """
         URL에서 플랫폼을 자동 감지합니다.
@@ -101,7 +119,7 @@ class MultiPlatformMonitor:
             
             # 네이버 스마트스토어인 경우 할인 정보 요약 추가
             if platform == 'naver_smartstore' and result.get('status') == 'success':
-                discount_summary = scraper.get_discount_summary(url)
+                discount_summary = scraper.summarize_discount(url, result)
                 result['discount_summary'] = discount_summary
                 if 'error' not in discount_summary:
                     logger.info(f"네이버 할인 정보 요약: {discount_summary.get('discount_amount', 0):,}원 할인")
@@ -139,7 +157,6 @@ class MultiPlatformMonitor:
             
             # 요청 간 딜레이 (서버 부하 방지)
             if i < len(urls):
-                import time
                 time.sleep(2)
         
         # 비교 결과 생성
@@ -222,7 +239,6 @@ class MultiPlatformMonitor:
         
         # JSON 파일로 저장
         json_path = output_path / "price_comparison.json"
-        import json
         with open(json_path, 'w', encoding='utf-8') as f:
             json.dump(comparison, f, ensure_ascii=False, indent=2)
         
@@ -245,14 +261,13 @@ def main():
     
     args = parser.parse_args()
     
-    # 모니터링 시스템 초기화
-    monitor = MultiPlatformMonitor()
-    
-    # 가격 비교 실행
-    comparison = monitor.compare_prices(args.urls, use_playwright=not args.no_playwright)
-    
-    # 결과 저장
-    monitor.save_results(comparison, args.output)
+    # 모니터링 시스템 초기화 (종료 시 스크래퍼의 브라우저 컨텍스트를 닫음)
+    with MultiPlatformMonitor() as monitor:
+        # 가격 비교 실행
+        comparison = monitor.compare_prices(args.urls, use_playwright=not args.no_playwright)
+        
+        # 결과 저장
+        monitor.save_results(comparison, args.output)
     
     print(f"\n✅ 가격 비교 완료! 결과가 {args.output} 디렉토리에 저장되었습니다.")
 
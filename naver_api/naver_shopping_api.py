@@ -4,9 +4,19 @@
 """
 
 import os
+import re
+import json
+import time
+import asyncio
+import httpx
+import pandas as pd
 import requests
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
 
 # 환경변수 로드
@@ -14,10 +24,150 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 네이버 API가 검색어 강조에 사용하는 <b> 태그
+_B_TAG_RE = re.compile(r'</?b>')
+
+
+class _ResponseCache:
+    """
+    검색 응답을 (keyword, display, start, sort) 단위로 보관하는 TTL 캐시입니다.
+    응답 본문은 JSON 바이트로 저장하여 호출자가 결과를 수정해도 캐시가 오염되지 않습니다.
+    """
+    
+    def __init__(self, ttl: float, max_entries: int):
+        """
+        캐시 초기화
+        
+        Args:
+            ttl (float): 응답 유효 시간 (초)
+            max_entries (int): 보관할 최대 응답 수
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """캐시 항목을 반환합니다. (만료된 항목도 재검증용으로 반환)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """TTL 이내의 항목인지 확인합니다."""
+        return entry['expires_at'] > time.monotonic()
+    
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """만료된 항목을 재검증하기 위한 조건부 요청 헤더를 생성합니다."""
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def put(self, key: Tuple, body: bytes, headers) -> None:
+        """응답 본문과 검증자(ETag, Last-Modified)를 저장합니다."""
+        with self._lock:
+            self._entries[key] = {
+                'body': body,
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'expires_at': time.monotonic() + self.ttl
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def refresh(self, key: Tuple) -> None:
+        """304 응답을 받은 항목의 유효 시간을 연장합니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry['expires_at'] = time.monotonic() + self.ttl
+
+
+class _TokenBucket:
+    """
+    초당 요청 수를 제한하는 토큰 버킷입니다. (스레드 안전)
+    토큰이 남아 있으면 바로 통과하고, 모자랄 때만 다음 토큰이 채워질 때까지 대기합니다.
+    호출 제한(429) 응답을 받으면 채움 속도를 낮추고, 성공 응답마다 설정값까지 서서히 회복합니다.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None, min_rate: float = 1.0):
+        """
+        토큰 버킷 초기화
+        
+        Args:
+            rate (float): 초당 채워지는 토큰 수 (최대 요청 속도)
+            capacity (Optional[float]): 버킷 크기 (순간 최대 요청 수, 기본값은 rate)
+            min_rate (float): 호출 제한 시 낮출 수 있는 최소 속도
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.min_rate = min_rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고, 토큰이 채워질 때까지 기다려야 하는 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def acquire(self) -> None:
+        """토큰을 하나 획득합니다. 토큰이 없으면 채워질 때까지 대기합니다."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self) -> None:
+        """acquire의 비동기 버전입니다. 이벤트 루프를 막지 않고 대기합니다."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def slow_down(self) -> None:
+        """호출 제한 응답을 받았을 때 채움 속도를 절반으로 낮춥니다."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+    
+    def recover(self) -> None:
+        """성공 응답을 받았을 때 채움 속도를 설정값까지 조금씩 회복합니다."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate * 1.1)
+
 
 class NaverShoppingAPI:
     """네이버 쇼핑 검색 API 클라이언트"""
     
+    # 페이지네이션 시 동시에 요청할 최대 페이지 수
+    MAX_CONCURRENT_REQUESTS = 4
+    
+    # 비동기 클라이언트의 최대 커넥션 수
+    MAX_ASYNC_CONNECTIONS = 10
+    
+    # 동일한 검색 요청의 응답을 재사용하는 시간 (초)과 최대 보관 수
+    CACHE_TTL_SECONDS = 300
+    CACHE_MAX_ENTRIES = 256
+    
+    # 초당 최대 API 호출 수 (토큰 버킷 채움 속도)
+    REQUESTS_PER_SECOND = 10
+    
+    # 호출 제한(429) 응답 시 재시도 횟수와 기본 대기 시간 (초, 시도마다 2배)
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_SECONDS = 1.0
+    
     def __init__(self):
         """API 클라이언트 초기화"""
         self.client_id = os.getenv('NAVER_CLIENT_ID')
@@ -31,6 +181,96 @@ class NaverShoppingAPI:
             'X-Naver-Client-Id': self.client_id,
             'X-Naver-Client-Secret': self.client_secret
         }
+        
+        # 커넥션 풀과 keep-alive를 재사용하는 공유 세션
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        # 동시 요청 수 제한 (API 호출 제한 준수)
+        self._request_slots = threading.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        
+        # 초당 호출 수 제한 (모든 검색 요청이 공유)
+        self._rate_limiter = _TokenBucket(self.REQUESTS_PER_SECOND)
+        
+        # 검색 응답 캐시
+        self._response_cache = _ResponseCache(self.CACHE_TTL_SECONDS, self.CACHE_MAX_ENTRIES)
+    
+    def _build_params(self, keyword: str, display: int, start: int, sort: str) -> Dict[str, Any]:
+        """검색 요청 파라미터를 생성합니다."""
+        return {
+            'query': keyword,
+            'display': min(display, 100),  # 최대 100개
+            'start': start,
+            'sort': sort
+        }
+    
+    def _cached_response(self, key: Tuple) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        캐시에서 응답을 조회합니다.
+        
+        Returns:
+            Tuple: (유효한 캐시 데이터 또는 None, 재검증에 사용할 캐시 항목 또는 None)
+        """
+        entry = self._response_cache.get(key)
+        if entry is not None and self._response_cache.is_fresh(entry):
+            logger.debug(f"캐시된 검색 결과 사용: {key}")
+            return json.loads(entry['body']), entry
+        return None, entry
+    
+    def _handle_response(self, key: Tuple, entry: Optional[Dict[str, Any]], status_code: int,
+                         content: bytes, headers) -> Dict[str, Any]:
+        """
+        검색 응답을 파싱하고 캐시에 반영합니다.
+        304 Not Modified 응답이면 캐시된 본문을 재사용합니다.
+        """
+        if status_code == 304 and entry is not None:
+            self._response_cache.refresh(key)
+            data = json.loads(entry['body'])
+        else:
+            self._response_cache.put(key, content, headers)
+            data = json.loads(content)
+        
+        logger.info(f"검색 결과: {data.get('total', 0)}개 상품 발견")
+        return data
+    
+    def _should_retry(self, status_code: int, attempt: int) -> bool:
+        """
+        응답 상태에 따라 호출 속도를 조정하고, 재시도가 필요한지 판단합니다.
+        429 응답이면 토큰 버킷 속도를 낮추고, 그 외에는 서서히 회복합니다.
+        """
+        if status_code != 429:
+            self._rate_limiter.recover()
+            return False
+        
+        self._rate_limiter.slow_down()
+        return attempt < self.MAX_RETRIES
+    
+    def _retry_delay(self, headers, attempt: int) -> float:
+        """
+        429 응답 후 다음 재시도까지 대기할 시간을 계산합니다.
+        Retry-After 헤더가 있으면 따르고, 없으면 지수 백오프를 적용합니다.
+        """
+        retry_after = headers.get('Retry-After')
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        return self.RETRY_BACKOFF_SECONDS * (2 ** attempt)
+    
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        비동기 검색에 사용할 HTTP/2 클라이언트를 생성합니다.
+        여러 검색을 동시에 실행할 때는 하나의 클라이언트를 만들어 공유하세요.
+        
+        Returns:
+            httpx.AsyncClient: 인증 헤더가 설정된 비동기 클라이언트
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=self.MAX_ASYNC_CONNECTIONS)
+        )
     
     def search_products(self, keyword: str, display: int = 100, start: int = 1, sort: str = 'sim') -> Dict[str, Any]:
         """
@@ -46,21 +286,32 @@ class NaverShoppingAPI:
             Dict[str, Any]: 검색 결과
         """
         try:
-            params = {
-                'query': keyword,
-                'display': min(display, 100),  # 최대 100개
-                'start': start,
-                'sort': sort
-            }
+            params = self._build_params(keyword, display, start, sort)
+            key = (keyword, params['display'], start, sort)
             
-            logger.info(f"네이버 쇼핑 검색: {keyword}")
-            response = requests.get(self.base_url, headers=self.headers, params=params)
-            response.raise_for_status()
+            data, entry = self._cached_response(key)
+            if data is not None:
+                return data
             
-            data = response.json()
-            logger.info(f"검색 결과: {data.get('total', 0)}개 상품 발견")
+            logger.info(f"네이버 쇼핑 검색: {keyword}")
+            for attempt in range(self.MAX_RETRIES + 1):
+                self._rate_limiter.acquire()
+                with self._request_slots:
+                    response = self.session.get(
+                        self.base_url, params=params,
+                        headers=self._response_cache.conditional_headers(entry)
+                    )
+                if not self._should_retry(response.status_code, attempt):
+                    break
+                
+                # 호출 제한 초과 시 대기 후 재시도
+                delay = self._retry_delay(response.headers, attempt)
+                logger.warning(f"API 호출 제한 초과, {delay:.1f}초 후 재시도: {keyword}")
+                time.sleep(delay)
+            if response.status_code != 304:
+                response.raise_for_status()
             
-            return data
+            return self._handle_response(key, entry, response.status_code, response.content, response.headers)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"네이버 API 요청 실패: {e}")
@@ -89,11 +340,13 @@ class NaverShoppingAPI:
         """
         try:
             # 가격 정보 추출
-            price_str = item.get('lprice', '0')
-            price = int(price_str) if price_str.isdigit() else 0
+            try:
+                price = int(item.get('lprice'))
+            except (TypeError, ValueError):
+                price = 0
             
             # 상품명에서 HTML 태그 제거
-            title = item.get('title', '').replace('<b>', '').replace('</b>', '')
+            title = _B_TAG_RE.sub('', item.get('title', ''))
             
             # 쇼핑몰 정보
             mall_name = item.get('mallName', '')
@@ -135,13 +388,33 @@ class NaverShoppingAPI:
         Returns:
             List[Dict[str, Any]]: 검색 결과 리스트
         """
-        all_items = []
-        start = 1
         display = 100
+        starts = list(range(1, max_results + 1, display))
+        
+        fetch_page = partial(self.search_products, keyword, display)
+        
+        # 필요한 페이지를 병렬로 요청
+        if len(starts) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_REQUESTS, len(starts))) as executor:
+                pages = list(executor.map(fetch_page, starts))
+        else:
+            pages = [fetch_page(start) for start in starts]
+        
+        return self._collect_items(pages, max_results)
+    
+    def _collect_items(self, pages: List[Dict[str, Any]], max_results: int) -> List[Dict[str, Any]]:
+        """
+        페이지 단위 검색 결과를 하나의 리스트로 합치고 가격 정보를 추출합니다.
         
-        while len(all_items) < max_results:
-            data = self.search_products(keyword, display=display, start=start)
+        Args:
+            pages (List[Dict[str, Any]]): 시작 위치 순서의 검색 결과
+            max_results (int): 최대 검색 결과 수
             
+        Returns:
+            List[Dict[str, Any]]: 검색 결과 리스트
+        """
+        raw_items = []
+        for data in pages:
             if 'error' in data:
                 logger.error(f"검색 실패: {data['error']}")
                 break
@@ -150,21 +423,113 @@ class NaverShoppingAPI:
             if not items:
                 break
             
-            # 가격 정보 추출
-            for item in items:
-                price_info = self.extract_price_info(item)
-                all_items.append(price_info)
-            
-            # 다음 페이지로 이동
-            start += display
-            
-            # API 호출 제한을 위한 딜레이
-            import time
-            time.sleep(0.1)
+            raw_items.extend(items)
             
             # 최대 결과 수에 도달하면 중단
-            if len(all_items) >= max_results:
+            if len(raw_items) >= max_results:
                 break
         
-        logger.info(f"총 {len(all_items)}개 상품 정보 수집 완료")
-        return all_items[:max_results] 
\ No newline at end of file
+        raw_items = raw_items[:max_results]
+        logger.info(f"총 {len(raw_items)}개 상품 정보 수집 완료")
+        if not raw_items:
+            return []
+        
+        # 가격 정보 추출 (아이템별 루프 대신 컬럼 단위로 한 번에 처리)
+        raw_df = pd.DataFrame(raw_items).reindex(columns=['title', 'lprice', 'mallName', 'link', 'image'])
+        text_columns = raw_df[['title', 'mallName', 'link', 'image']].fillna('').astype(str)
+        price_df = pd.DataFrame({
+            'title': text_columns['title'].str.replace(_B_TAG_RE, '', regex=True),
+            'price': pd.to_numeric(raw_df['lprice'], errors='coerce').fillna(0).astype('int64'),
+            'mall_name': text_columns['mallName'],
+            'product_link': text_columns['link'],
+            'image_url': text_columns['image'],
+            'raw_item': raw_items
+        })
+        
+        return price_df.to_dict('records')
+    
+    async def asearch_products(self, keyword: str, display: int = 100, start: int = 1, sort: str = 'sim',
+                               client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+        """
+        search_products의 비동기 버전입니다.
+        
+        Args:
+            keyword (str): 검색 키워드
+            display (int): 검색 결과 개수 (최대 100)
+            start (int): 검색 시작 위치
+            sort (str): 정렬 방식
+            client (Optional[httpx.AsyncClient]): 공유할 비동기 클라이언트 (없으면 새로 생성)
+            
+        Returns:
+            Dict[str, Any]: 검색 결과
+        """
+        if client is None:
+            async with self.async_client() as own_client:
+                return await self.asearch_products(keyword, display, start, sort, client=own_client)
+        
+        try:
+            params = self._build_params(keyword, display, start, sort)
+            key = (keyword, params['display'], start, sort)
+            
+            data, entry = self._cached_response(key)
+            if data is not None:
+                return data
+            
+            logger.info(f"네이버 쇼핑 검색: {keyword}")
+            for attempt in range(self.MAX_RETRIES + 1):
+                await self._rate_limiter.acquire_async()
+                response = await client.get(
+                    self.base_url, params=params,
+                    headers=self._response_cache.conditional_headers(entry)
+                )
+                if not self._should_retry(response.status_code, attempt):
+                    break
+                
+                # 호출 제한 초과 시 대기 후 재시도
+                delay = self._retry_delay(response.headers, attempt)
+                logger.warning(f"API 호출 제한 초과, {delay:.1f}초 후 재시도: {keyword}")
+                await asyncio.sleep(delay)
+            if response.status_code != 304:
+                response.raise_for_status()
+            
+            return self._handle_response(key, entry, response.status_code, response.content, response.headers)
+            
+        except httpx.HTTPError as e:
+            logger.error(f"네이버 API 요청 실패: {e}")
+            return {
+                'error': str(e),
+                'items': [],
+                'total': 0
+            }
+        except Exception as e:
+            logger.error(f"검색 중 오류 발생: {e}")
+            return {
+                'error': str(e),
+                'items': [],
+                'total': 0
+            }
+    
+    async def asearch_with_pagination(self, keyword: str, max_results: int = 200,
+                                      client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, Any]]:
+        """
+        search_with_pagination의 비동기 버전입니다. 모든 페이지를 동시에 요청합니다.
+        
+        Args:
+            keyword (str): 검색 키워드
+            max_results (int): 최대 검색 결과 수
+            client (Optional[httpx.AsyncClient]): 공유할 비동기 클라이언트 (없으면 새로 생성)
+            
+        Returns:
+            List[Dict[str, Any]]: 검색 결과 리스트
+        """
+        if client is None:
+            async with self.async_client() as own_client:
+                return await self.asearch_with_pagination(keyword, max_results, client=own_client)
+        
+        display = 100
+        pages = await asyncio.gather(*(
+            self.asearch_products(keyword, display=display, start=start, client=client)
+            for start in range(1, max_results + 1, display)
+        ))
+        
+        return self._collect_items(pages, max_results)
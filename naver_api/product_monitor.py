@@ -3,10 +3,16 @@
 네이버 쇼핑 API를 활용하여 특정 제품들의 리셀러 가격을 모니터링합니다.
 """
 
-import json
+import re
+import asyncio
 import logging
+import orjson
 import pandas as pd
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import compress, islice
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -15,9 +21,33 @@ from .naver_shopping_api import NaverShoppingAPI
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    설정 파일을 파싱합니다. (path, mtime_ns)가 캐시 키이므로 파일이 수정되면 다시 읽습니다.
+    반환된 설정은 여러 인스턴스가 공유하므로 수정하지 않아야 합니다.
+    """
+    return orjson.loads(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=32)
+def _compile_exclude_pattern(keywords_lower: Tuple[str, ...]) -> "re.Pattern":
+    """
+    소문자 제외 키워드들을 하나의 정규식(alternation)으로 컴파일합니다.
+    같은 키워드 조합은 컴파일된 패턴을 재사용하며, 제목을 한 번만 훑어 모든 키워드를 검사합니다.
+    """
+    return re.compile('|'.join(map(re.escape, keywords_lower)))
+
+
 class ProductMonitor:
     """제품별 모니터링 클래스"""
     
+    # 동시에 모니터링할 최대 제품 수 (스레드 풀/비동기 공통)
+    MAX_CONCURRENT_PRODUCTS = 8
+    
+    # 네이버 쇼핑 API가 한 검색어로 조회할 수 있는 최대 결과 수 (start 최대값)
+    MAX_SEARCH_RESULTS = 1000
+    
     def __init__(self, config_path: str = "data/product_config.json"):
         """
         모니터링 시스템 초기화
@@ -29,48 +59,59 @@ class ProductMonitor:
         self.api_client = NaverShoppingAPI()
         self.config = self._load_config()
         
+        # 설정의 제외 키워드는 로드 시 한 번만 소문자로 변환
+        self._exclude_keywords_lower = tuple(
+            keyword.lower()
+            for keyword in self.config.get('monitoring_settings', {}).get('exclude_keywords', [])
+        )
+        
     def _load_config(self) -> Dict[str, Any]:
         """설정 파일을 로드합니다."""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = _load_config_cached(str(self.config_path), self.config_path.stat().st_mtime_ns)
             logger.info(f"설정 파일 로드 완료: {self.config_path}")
             return config
         except Exception as e:
             logger.error(f"설정 파일 로드 실패: {e}")
             raise
     
-    def filter_reseller_items(self, items: List[Dict[str, Any]], exclude_keywords: List[str] = None) -> List[Dict[str, Any]]:
+    def filter_reseller_items(self, items: List[Dict[str, Any]], exclude_keywords: List[str] = None,
+                              limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         리셀러 아이템을 필터링합니다.
         
         Args:
             items (List[Dict[str, Any]]): 검색된 아이템 리스트
             exclude_keywords (List[str]): 제외할 키워드 리스트
+            limit (Optional[int]): 반환할 최대 아이템 수 (앞에서부터, None이면 제한 없음)
             
         Returns:
             List[Dict[str, Any]]: 필터링된 리셀러 아이템 리스트
         """
+        settings = self.config.get('monitoring_settings', {})
         if exclude_keywords is None:
-            exclude_keywords = self.config.get('monitoring_settings', {}).get('exclude_keywords', [])
+            exclude_keywords_lower = self._exclude_keywords_lower
+        else:
+            exclude_keywords_lower = tuple(keyword.lower() for keyword in exclude_keywords)
         
-        filtered_items = []
+        min_price = settings.get('min_price_threshold', 10000)
+        max_price = settings.get('max_price_threshold', 1000000)
         
-        for item in items:
-            title = item.get('title', '').lower()
-            mall_name = item.get('mall_name', '').lower()
-            
-            # 제외 키워드가 포함된 상품 제외
-            should_exclude = any(keyword.lower() in title for keyword in exclude_keywords)
-            
-            if not should_exclude:
-                # 가격 임계값 확인
-                min_price = self.config.get('monitoring_settings', {}).get('min_price_threshold', 10000)
-                max_price = self.config.get('monitoring_settings', {}).get('max_price_threshold', 1000000)
-                item_price = item.get('price', 0)
-                
-                if min_price <= item_price <= max_price:
-                    filtered_items.append(item)
+        if not items:
+            return []
+        
+        # 제목/가격 컬럼만 벡터화하여 마스크 계산
+        df = pd.DataFrame(items, columns=['title', 'price'])
+        keep = df['price'].fillna(0).between(min_price, max_price)
+        
+        # 제외 키워드가 포함된 상품 제외
+        if exclude_keywords_lower:
+            pattern = _compile_exclude_pattern(exclude_keywords_lower)
+            excluded = df['title'].fillna('').str.lower().str.contains(pattern, regex=True)
+            keep &= ~excluded
+        
+        # 원본 아이템 dict를 그대로 유지한 채 선택 (limit개를 채우면 중단)
+        filtered_items = list(islice(compress(items, keep.tolist()), limit))
         
         logger.info(f"리셀러 아이템 필터링 완료: {len(items)}개 → {len(filtered_items)}개")
         return filtered_items
@@ -92,12 +133,17 @@ class ProductMonitor:
         discount_rate = ((original_price - current_price) / original_price) * 100
         return round(discount_rate, 2)
     
-    def monitor_product(self, product_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _max_results_per_product(self) -> int:
+        """제품당 최대 검색 결과 수를 반환합니다."""
+        return self.config.get('monitoring_settings', {}).get('max_results_per_product', 100)
+    
+    def _build_product_result(self, product_config: Dict[str, Any], items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        단일 제품을 모니터링합니다.
+        검색된 아이템을 필터링하고 할인율을 계산해 제품별 결과를 만듭니다.
         
         Args:
             product_config (Dict[str, Any]): 제품 설정 정보
+            items (List[Dict[str, Any]]): 검색된 아이템 리스트
             
         Returns:
             Dict[str, Any]: 모니터링 결과
@@ -106,59 +152,120 @@ class ProductMonitor:
         keyword = product_config['keyword']
         original_price = product_config['original_price']
         
+        # 리셀러 아이템 필터링 (제품당 최대 결과 수까지만)
+        filtered_items = self.filter_reseller_items(items, limit=self._max_results_per_product())
+        
+        # 할인율 계산 및 결과 정리 (검색 시각과 메서드는 루프 밖에서 한 번만 조회)
+        search_timestamp = datetime.now().isoformat()
+        calculate_discount_rate = self.calculate_discount_rate
+        
+        results = []
+        for item in filtered_items:
+            price = item['price']
+            
+            result = {
+                'product_name': product_name,
+                'title': item['title'],
+                'price': price,
+                'original_price': original_price,
+                'discount_rate': calculate_discount_rate(price, original_price),
+                'discount_amount': original_price - price,
+                'mall_name': item['mall_name'],
+                'product_link': item['product_link'],
+                'image_url': item['image_url'],
+                'search_timestamp': search_timestamp
+            }
+            results.append(result)
+        
+        # 가격순으로 정렬
+        results.sort(key=itemgetter('price'))
+        
+        logger.info(f"제품 모니터링 완료: {product_name} - {len(results)}개 리셀러 발견")
+        
+        return {
+            'product_name': product_name,
+            'keyword': keyword,
+            'original_price': original_price,
+            'total_items': len(items),
+            'filtered_items': len(filtered_items),
+            'reseller_count': len(results),
+            'results': results,
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    def _error_result(self, product_name: str, error: Exception) -> Dict[str, Any]:
+        """모니터링 실패 시의 제품별 결과를 만듭니다."""
+        logger.error(f"제품 모니터링 실패 ({product_name}): {error}")
+        return {
+            'product_name': product_name,
+            'error': str(error),
+            'results': [],
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    def _build_summary(self, target_products: List[Dict[str, Any]], all_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """제품별 결과로 전체 요약 정보를 생성합니다."""
+        total_resellers = sum(len(r.get('results', [])) for r in all_results)
+        total_products = len(target_products)
+        
+        summary = {
+            'total_products': total_products,
+            'total_resellers': total_resellers,
+            'monitoring_timestamp': datetime.now().isoformat(),
+            'products': all_results
+        }
+        
+        logger.info(f"전체 모니터링 완료: {total_products}개 제품, {total_resellers}개 리셀러")
+        
+        return summary
+    
+    def monitor_product(self, product_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        단일 제품을 모니터링합니다.
+        
+        Args:
+            product_config (Dict[str, Any]): 제품 설정 정보
+            
+        Returns:
+            Dict[str, Any]: 모니터링 결과
+        """
+        product_name = product_config['name']
+        
         logger.info(f"제품 모니터링 시작: {product_name}")
         
         try:
             # 네이버 쇼핑 검색
-            max_results = self.config.get('monitoring_settings', {}).get('max_results_per_product', 100)
-            items = self.api_client.search_with_pagination(keyword, max_results)
-            
-            # 리셀러 아이템 필터링
-            filtered_items = self.filter_reseller_items(items)
-            
-            # 할인율 계산 및 결과 정리
-            results = []
-            for item in filtered_items:
-                discount_rate = self.calculate_discount_rate(item['price'], original_price)
-                
-                result = {
-                    'product_name': product_name,
-                    'title': item['title'],
-                    'price': item['price'],
-                    'original_price': original_price,
-                    'discount_rate': discount_rate,
-                    'discount_amount': original_price - item['price'],
-                    'mall_name': item['mall_name'],
-                    'product_link': item['product_link'],
-                    'image_url': item['image_url'],
-                    'search_timestamp': datetime.now().isoformat()
-                }
-                results.append(result)
+            items = self.api_client.search_with_pagination(product_config['keyword'], self._max_results_per_product())
+            return self._build_product_result(product_config, items)
             
-            # 가격순으로 정렬
-            results.sort(key=lambda x: x['price'])
-            
-            logger.info(f"제품 모니터링 완료: {product_name} - {len(results)}개 리셀러 발견")
+        except Exception as e:
+            return self._error_result(product_name, e)
+    
+    async def monitor_product_async(self, product_config: Dict[str, Any],
+                                    client=None) -> Dict[str, Any]:
+        """
+        monitor_product의 비동기 버전입니다.
+        
+        Args:
+            product_config (Dict[str, Any]): 제품 설정 정보
+            client (Optional[httpx.AsyncClient]): 공유할 비동기 클라이언트
             
-            return {
-                'product_name': product_name,
-                'keyword': keyword,
-                'original_price': original_price,
-                'total_items': len(items),
-                'filtered_items': len(filtered_items),
-                'reseller_count': len(results),
-                'results': results,
-                'timestamp': datetime.now().isoformat()
-            }
+        Returns:
+            Dict[str, Any]: 모니터링 결과
+        """
+        product_name = product_config['name']
+        
+        logger.info(f"제품 모니터링 시작: {product_name}")
+        
+        try:
+            # 네이버 쇼핑 검색 (페이지 동시 요청)
+            items = await self.api_client.asearch_with_pagination(
+                product_config['keyword'], self._max_results_per_product(), client=client
+            )
+            return self._build_product_result(product_config, items)
             
         except Exception as e:
-            logger.error(f"제품 모니터링 실패 ({product_name}): {e}")
-            return {
-                'product_name': product_name,
-                'error': str(e),
-                'results': [],
-                'timestamp': datetime.now().isoformat()
-            }
+            return self._error_result(product_name, e)
     
     def monitor_all_products(self) -> Dict[str, Any]:
         """
@@ -172,28 +279,110 @@ class ProductMonitor:
         
         logger.info(f"전체 제품 모니터링 시작: {len(target_products)}개 제품")
         
-        for product_config in target_products:
-            result = self.monitor_product(product_config)
-            all_results.append(result)
+        # 제품별 검색을 스레드 풀에서 동시에 실행 (API 호출 간격은 API 클라이언트의 토큰 버킷이 조절)
+        if target_products:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_PRODUCTS, len(target_products))) as executor:
+                all_results = list(executor.map(self.monitor_product, target_products))
+        
+        return self._build_summary(target_products, all_results)
+    
+    async def amonitor_all_products(self) -> Dict[str, Any]:
+        """
+        모든 타겟 제품을 동시에 모니터링합니다.
+        하나의 비동기 클라이언트를 공유하며, 동시에 진행하는 제품 수는
+        MAX_CONCURRENT_PRODUCTS로 제한됩니다.
+        
+        Returns:
+            Dict[str, Any]: 전체 모니터링 결과
+        """
+        target_products = self.config.get('target_products', [])
+        
+        logger.info(f"전체 제품 모니터링 시작: {len(target_products)}개 제품")
+        
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PRODUCTS)
+        
+        async with self.api_client.async_client() as client:
+            async def monitor_with_slot(product_config: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.monitor_product_async(product_config, client=client)
             
-            # API 호출 간격 조절
-            import time
-            time.sleep(1)
+            all_results = await asyncio.gather(*(
+                monitor_with_slot(product_config) for product_config in target_products
+            ))
         
-        # 전체 요약 정보 생성
-        total_resellers = sum(len(r.get('results', [])) for r in all_results)
-        total_products = len(target_products)
+        return self._build_summary(target_products, list(all_results))
+    
+    def _route_batched_items(self, product_configs: List[Dict[str, Any]],
+                             items: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        묶음 검색 결과를 제품별로 나눕니다.
+        키워드의 모든 단어가 제목에 포함된 첫 번째 제품에 배정하며, 어느 제품에도 맞지 않는 아이템은 버립니다.
         
-        summary = {
-            'total_products': total_products,
-            'total_resellers': total_resellers,
-            'monitoring_timestamp': datetime.now().isoformat(),
-            'products': all_results
-        }
+        Args:
+            product_configs (List[Dict[str, Any]]): 묶음에 포함된 제품 설정 리스트
+            items (List[Dict[str, Any]]): 묶음 검색으로 얻은 아이템 리스트
+            
+        Returns:
+            List[List[Dict[str, Any]]]: product_configs 순서대로 나뉜 아이템 리스트
+        """
+        keyword_tokens = [p['keyword'].lower().split() for p in product_configs]
+        routed = [[] for _ in product_configs]
         
-        logger.info(f"전체 모니터링 완료: {total_products}개 제품, {total_resellers}개 리셀러")
+        for item in items:
+            title = item.get('title', '').lower()
+            for index, tokens in enumerate(keyword_tokens):
+                if all(token in title for token in tokens):
+                    routed[index].append(item)
+                    break
         
-        return summary
+        return routed
+    
+    def monitor_products_batched(self, product_configs: Optional[List[Dict[str, Any]]] = None,
+                                 batch_size: int = 10) -> Dict[str, Any]:
+        """
+        여러 제품의 키워드를 OR 검색어(` | `)로 묶어 API 호출 수를 줄여 모니터링합니다.
+        검색 결과는 키워드와 제목을 비교해 제품별로 다시 나눕니다.
+        
+        묶음 검색은 제품별 검색과 정확도 순위가 달라 결과가 다를 수 있으므로,
+        제품 수가 많아 호출 수가 문제가 될 때만 사용하세요.
+        
+        Args:
+            product_configs (Optional[List[Dict[str, Any]]]): 제품 설정 리스트 (기본값: 설정 파일의 target_products)
+            batch_size (int): 한 번의 검색에 묶을 제품 수
+            
+        Returns:
+            Dict[str, Any]: 전체 모니터링 결과
+        """
+        if product_configs is None:
+            product_configs = self.config.get('target_products', [])
+        
+        logger.info(f"묶음 제품 모니터링 시작: {len(product_configs)}개 제품 (묶음 크기 {batch_size})")
+        
+        all_results = []
+        for start in range(0, len(product_configs), batch_size):
+            batch = product_configs[start:start + batch_size]
+            query = ' | '.join(p['keyword'] for p in batch)
+            max_results = min(self._max_results_per_product() * len(batch), self.MAX_SEARCH_RESULTS)
+            
+            try:
+                items = self.api_client.search_with_pagination(query, max_results)
+            except Exception as e:
+                all_results.extend(self._error_result(p['name'], e) for p in batch)
+                continue
+            
+            for product_config, product_items in zip(batch, self._route_batched_items(batch, items)):
+                all_results.append(self._build_product_result(product_config, product_items))
+        
+        return self._build_summary(product_configs, all_results)
+    
+    @staticmethod
+    def _flatten_resellers(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """모든 제품의 리셀러 결과를 하나의 리스트로 펼칩니다."""
+        return [
+            reseller
+            for product_result in results.get('products', [])
+            for reseller in product_result.get('results', [])
+        ]
     
     def save_results(self, results: Dict[str, Any], output_dir: str = "results") -> str:
         """
@@ -214,22 +403,20 @@ class ProductMonitor:
         json_filename = f"monitoring_results_{timestamp}.json"
         json_path = output_path / json_filename
         
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        json_path.write_bytes(orjson.dumps(
+            results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ))
         
-        # CSV 파일로 저장 (리셀러 정보만)
-        csv_filename = f"reseller_data_{timestamp}.csv"
-        csv_path = output_path / csv_filename
+        # Parquet 파일로 저장 (리셀러 정보만, 컬럼 형식이라 대시보드에서 바로 읽음)
+        parquet_filename = f"reseller_data_{timestamp}.parquet"
+        parquet_path = output_path / parquet_filename
         
-        all_reseller_data = []
-        for product_result in results.get('products', []):
-            for reseller in product_result.get('results', []):
-                all_reseller_data.append(reseller)
+        all_reseller_data = self._flatten_resellers(results)
         
         if all_reseller_data:
             df = pd.DataFrame(all_reseller_data)
-            df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-            logger.info(f"CSV 파일 저장 완료: {csv_path}")
+            df.to_parquet(parquet_path, engine='pyarrow', compression='snappy', index=False)
+            logger.info(f"Parquet 파일 저장 완료: {parquet_path}")
         
         logger.info(f"결과 저장 완료: {json_path}")
         return str(json_path)
@@ -244,11 +431,7 @@ class ProductMonitor:
         Returns:
             pd.DataFrame: 변환된 DataFrame
         """
-        all_reseller_data = []
-        
-        for product_result in results.get('products', []):
-            for reseller in product_result.get('results', []):
-                all_reseller_data.append(reseller)
+        all_reseller_data = self._flatten_resellers(results)
         
         if all_reseller_data:
             df = pd.DataFrame(all_reseller_data)
@@ -4,8 +4,10 @@
 """
 
 import sys
+import asyncio
 import argparse
 import logging
+from operator import itemgetter
 from pathlib import Path
 
 # 프로젝트 모듈 import
@@ -38,7 +40,7 @@ def main():
         
         # 전체 제품 모니터링 실행
         logger.info("모니터링 시작...")
-        results = monitor.monitor_all_products()
+        results = asyncio.run(monitor.amonitor_all_products())
         
         # 결과 저장
         output_path = monitor.save_results(results, args.output)
@@ -68,7 +70,7 @@ def main():
             
             # 최저가 정보
             if product_result.get('results'):
-                min_price_item = min(product_result['results'], key=lambda x: x['price'])
+                min_price_item = min(product_result['results'], key=itemgetter('price'))
                 min_price = min_price_item['price']
                 min_discount = min_price_item['discount_rate']
                 min_mall = min_price_item['mall_name']
@@ -4,9 +4,10 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +15,9 @@ logger = logging.getLogger(__name__)
 class BaseScraper(ABC):
     """스크래퍼 기본 추상 클래스"""
     
+    # 초 단위로 재사용하는 타임스탬프 (epoch 초, ISO 문자열) - 모든 스크래퍼가 공유
+    _cached_timestamp: Tuple[int, str] = (-1, '')
+    
     def __init__(self, platform_name: str):
         """
         기본 스크래퍼 초기화
@@ -112,19 +116,36 @@ class BaseScraper(ABC):
         discount_rate = ((original_price - current_price) / original_price) * 100
         return round(discount_rate, 2)
     
-    def format_result(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def current_timestamp() -> str:
+        """
+        현재 시각의 ISO 문자열을 반환합니다. (초 단위)
+        같은 초 안의 호출은 이전에 만든 문자열을 재사용합니다.
+        
+        Returns:
+            str: ISO 형식 타임스탬프
+        """
+        now = int(time.time())
+        cached_second, cached_iso = BaseScraper._cached_timestamp
+        if now != cached_second:
+            cached_iso = datetime.fromtimestamp(now).isoformat()
+            BaseScraper._cached_timestamp = (now, cached_iso)
+        return cached_iso
+    
+    def format_result(self, data: Dict[str, Any], timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         스크래핑 결과를 표준 형식으로 포맷팅합니다.
         
         Args:
             data (Dict[str, Any]): 원본 데이터
+            timestamp (Optional[str]): 결과에 기록할 타임스탬프 (일괄 처리 시 한 번 계산해 전달, 없으면 현재 시각)
             
         Returns:
             Dict[str, Any]: 포맷팅된 결과
         """
         return {
             'platform': self.platform_name,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp or self.current_timestamp(),
             'price': data.get('price', 0.0),
             'title': data.get('title', ''),
             'stock': data.get('stock', 0),
@@ -3,13 +3,26 @@
 JSON 설정 파일을 통해 다양한 플랫폼을 지원하는 범용 스크래퍼입니다.
 """
 
-import json
 import re
-from typing import Dict, Any, Optional, List
+import json
+import codecs
+import atexit
+import asyncio
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Union, Iterator, Iterable, Sequence, Tuple
 from pathlib import Path
 from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+import soupsieve
+from cssselect import HTMLTranslator, SelectorError
+from lxml import etree
+from lxml import html as lxml_html
 import requests
-from playwright.sync_api import sync_playwright, Page, Browser
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, Route
+from playwright.sync_api import Error as PlaywrightError
 import logging
 from datetime import datetime
 
@@ -17,10 +30,357 @@ from .base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# 파싱된 HTML (기본은 lxml 트리, XPath를 쓸 수 없을 때는 BeautifulSoup)
+ParsedHtml = Union[lxml_html.HtmlElement, BeautifulSoup]
+
+# extract_* 메서드가 받는 입력 (HTML 문자열 또는 파싱된 HTML)
+HtmlOrDocument = Union[str, lxml_html.HtmlElement, BeautifulSoup]
+
+
+def _create_session() -> requests.Session:
+    """
+    커넥션 풀과 재시도 정책이 설정된 requests 세션을 생성합니다.
+    같은 호스트로의 반복 요청에서 TCP/TLS 연결을 재사용합니다.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# 모든 PlatformScraper 인스턴스가 공유하는 HTTP 세션
+_SESSION = _create_session()
+
+# 여러 scrape_with_playwright 호출이 공유하는 Playwright 인스턴스와 브라우저 (첫 사용 시 실행)
+_PLAYWRIGHT = None
+_BROWSER: Optional[Browser] = None
+
+
+def _get_browser() -> Browser:
+    """
+    공유 Chromium 브라우저를 반환합니다. 처음 호출될 때 한 번만 실행합니다.
+    Playwright sync API 객체는 생성한 스레드에서만 사용할 수 있습니다.
+    """
+    global _PLAYWRIGHT, _BROWSER
+    if _BROWSER is None or not _BROWSER.is_connected():
+        if _PLAYWRIGHT is None:
+            _PLAYWRIGHT = sync_playwright().start()
+        _BROWSER = _PLAYWRIGHT.chromium.launch(headless=True)
+    return _BROWSER
+
+
+def _close_browser() -> None:
+    """공유 브라우저와 Playwright 인스턴스를 종료합니다."""
+    global _PLAYWRIGHT, _BROWSER
+    if _BROWSER is not None:
+        _BROWSER.close()
+        _BROWSER = None
+    if _PLAYWRIGHT is not None:
+        _PLAYWRIGHT.stop()
+        _PLAYWRIGHT = None
+
+
+atexit.register(_close_browser)
+
+# 그룹별 선택자 목록에서 텍스트가 있는 첫 요소를 [선택자, 텍스트]로 반환하는 스크립트
+_PICK_TEXTS_JS = """
+(groups) => {
+    const pick = (selectors) => {
+        for (const selector of selectors) {
+            const element = document.querySelector(selector);
+            const text = element && element.innerText.trim();
+            if (text) return [selector, text];
+        }
+        return null;
+    };
+    const picked = {};
+    for (const [key, selectors] of Object.entries(groups)) picked[key] = pick(selectors);
+    return picked;
+}
+"""
+
+# 가격/제목 추출과 무관해 Playwright에서 내려받지 않는 리소스 유형
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'stylesheet', 'media'})
+
+
+def _block_heavy_resources(route: Route) -> None:
+    """이미지/폰트/스타일시트/미디어 요청은 중단하고 나머지는 그대로 진행합니다."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+# 가격/재고 텍스트에서 숫자(쉼표 포함) 부분을 찾는 패턴
+_NUMBER_RE = re.compile(r'[\d,]+')
+
+# 할인율 텍스트에서 정수/소수 부분을 찾는 패턴
+_DECIMAL_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+# 스트리밍 응답을 파서에 넣는 조각 크기 (바이트)
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# BeautifulSoup 파서 (C로 구현된 lxml 파서 사용)
+_HTML_PARSER = 'lxml'
+
+# 문서 앞부분의 <meta charset="..."> / <meta http-equiv content="...; charset=..."> 선언
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+?charset\s*=\s*["\']?\s*([A-Za-z0-9_.:-]+)', re.IGNORECASE)
+
+
+def _resolve_encoding(declared: Optional[str], head: bytes) -> str:
+    """
+    본문을 디코딩할 인코딩을 정합니다.
+    응답 헤더의 charset, 문서 앞부분의 <meta> 선언, UTF-8 순서로 사용하며 Latin-1로 추측하지 않습니다.
+    
+    Args:
+        declared (Optional[str]): 응답 헤더에 선언된 인코딩 (없으면 None)
+        head (bytes): 본문 앞부분
+        
+    Returns:
+        str: 사용할 인코딩 이름
+        
+    Examples:
+        >>> body = '<title>한글 제목</title>'.encode('utf-8')
+        >>> _resolve_encoding(None, body)
+        'utf-8'
+        >>> parser = lxml_html.HTMLParser(encoding=_resolve_encoding(None, body))
+        >>> lxml_html.fromstring(body, parser=parser).findtext('.//title')
+        '한글 제목'
+        >>> _resolve_encoding(None, b'<meta charset="euc-kr"><title>...</title>')
+        'euc-kr'
+        >>> _resolve_encoding('cp949', b'<meta charset="utf-8">')
+        'cp949'
+        >>> _resolve_encoding('no-such-codec', b'')
+        'utf-8'
+    """
+    candidates = [declared]
+    match = _META_CHARSET_RE.search(head)
+    if match:
+        candidates.append(match.group(1).decode('ascii'))
+    
+    for encoding in candidates:
+        if not encoding:
+            continue
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            continue
+        return encoding
+    return 'utf-8'
+
+# 네이버 스마트스토어 특화 선택자들
+_NAVER_PRICE_SELECTORS = (
+    '#finalDscPrcArea .price strong .value',
+    '.price_area .sale_price strong',
+    '.price_area .final_price strong',
+    '.price_area .price strong',
+    '.price strong .value'
+)
+
+_NAVER_ORIGINAL_PRICE_SELECTORS = (
+    '.price_area .original_price_area .price',
+    '.price_area .list_price',
+    '.price_area .before_price',
+    '.price_area .strike_price',
+    '.original_price strong'
+)
+
+_NAVER_DISCOUNT_RATE_SELECTORS = (
+    '.price_area .discount_rate_area .rate',
+    '.price_area .sale_rate_area .rate',
+    '.price_area .discount_rate',
+    '.price_area .sale_rate',
+    '.discount_rate'
+)
+
+# Playwright에서 한 번에 조회하는 선택자 그룹
+_NAVER_PRICE_SELECTOR_GROUPS = {
+    'price': _NAVER_PRICE_SELECTORS,
+    'original_price': _NAVER_ORIGINAL_PRICE_SELECTORS,
+    'discount_rate': _NAVER_DISCOUNT_RATE_SELECTORS
+}
+
+_GENERAL_PRICE_SELECTOR_GROUPS = {
+    'price': ('.price strong .value',)
+}
+
+# Playwright 페이지 헤더 (네이버 스마트스토어)
+_NAVER_PLAYWRIGHT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+    'Referer': 'https://smartstore.naver.com/'
+}
+
+# Playwright 페이지 헤더 (11번가 및 기타 플랫폼)
+_ELEVENST_PLAYWRIGHT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+    'Referer': 'https://www.11st.co.kr/'
+}
+
+@lru_cache(maxsize=None)
+def _compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """
+    CSS 선택자를 한 번만 컴파일해 모든 인스턴스가 공유합니다.
+    
+    Args:
+        selector (str): CSS 선택자
+        
+    Returns:
+        soupsieve.SoupSieve: 컴파일된 선택자
+    """
+    return soupsieve.compile(selector)
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    플랫폼 설정 파일을 파싱합니다. (path, mtime_ns)가 캐시 키이므로 파일이 수정되면 다시 읽습니다.
+    반환된 설정은 여러 인스턴스가 공유하므로 수정하지 않아야 합니다.
+    """
+    return json.loads(Path(path).read_text(encoding='utf-8'))
+
+
+_CSS_TRANSLATOR = HTMLTranslator()
+
+
+@lru_cache(maxsize=None)
+def _compile_xpath(selector: str) -> Optional[etree.XPath]:
+    """
+    CSS 선택자를 첫 일치 요소만 반환하는 XPath로 변환해 한 번만 컴파일합니다.
+    
+    Args:
+        selector (str): CSS 선택자
+        
+    Returns:
+        Optional[etree.XPath]: 컴파일된 XPath (cssselect가 지원하지 않는 선택자면 None)
+    """
+    try:
+        return etree.XPath(f"({_CSS_TRANSLATOR.css_to_xpath(selector)})[1]")
+    except SelectorError:
+        return None
+
+
+# 클래스 하나 또는 ID 하나만으로 된 선택자 ('.price', '#finalDscPrcArea')
+_SIMPLE_SELECTOR_RE = re.compile(r'^([.#])([\w-]+)$')
+
+
+@lru_cache(maxsize=None)
+def _simple_lookup(selector: str) -> Optional[Dict[str, str]]:
+    """
+    단순 선택자를 BeautifulSoup.find 인자로 바꿉니다.
+    
+    Args:
+        selector (str): CSS 선택자
+        
+    Returns:
+        Optional[Dict[str, str]]: find에 넘길 키워드 인자 (단순 선택자가 아니면 None)
+    """
+    match = _SIMPLE_SELECTOR_RE.match(selector.strip())
+    if not match:
+        return None
+    kind, name = match.groups()
+    return {'class_': name} if kind == '.' else {'id': name}
+
+
+# 선택자에서 태그 이름/클래스/ID/속성 이름을 뽑는 패턴
+_SELECTOR_TAG_RE = re.compile(r'(?:^|[\s>+~,(])([a-zA-Z][\w-]*)')
+_SELECTOR_CLASS_RE = re.compile(r'\.([\w-]+)')
+_SELECTOR_ID_RE = re.compile(r'#([\w-]+)')
+_SELECTOR_ATTR_RE = re.compile(r'\[\s*([\w-]+)')
+# 토큰만으로 범위를 정할 수 없는 선택자 문법 (전체 선택자, 의사 클래스, 형제 결합자)
+_UNSCOPABLE_SELECTOR_RE = re.compile(r'[*:+~]')
+
+
+class _SelectorStrainer(ElementFilter):
+    """
+    설정된 선택자에 등장하는 태그 이름, 클래스, ID, 속성 중 하나라도 가진 최상위 요소만 파싱하는 필터입니다.
+    
+    일치한 요소는 하위 트리 전체가 유지되므로, 모든 선택자의 첫 요소가 일치하는 한
+    후손 선택자의 조회 결과는 전체 문서를 파싱했을 때와 같습니다.
+    """
+    
+    def __init__(self, selectors: Iterable[str]):
+        """
+        Args:
+            selectors (Iterable[str]): 범위를 정할 CSS 선택자들
+        """
+        super().__init__()
+        selectors = list(selectors)
+        joined = ' '.join(selectors)
+        self.tags = frozenset(tag.lower() for tag in _SELECTOR_TAG_RE.findall(joined))
+        self.classes = frozenset(_SELECTOR_CLASS_RE.findall(joined))
+        self.ids = frozenset(_SELECTOR_ID_RE.findall(joined))
+        self.attributes = frozenset(_SELECTOR_ATTR_RE.findall(joined))
+    
+    @classmethod
+    def for_selectors(cls, selectors: Iterable[str]) -> Optional["_SelectorStrainer"]:
+        """
+        선택자들로 필터를 만듭니다. 범위를 안전하게 정할 수 없는 선택자가 있으면 None을 반환합니다.
+        """
+        selectors = [selector for selector in selectors if selector]
+        if not selectors or any(_UNSCOPABLE_SELECTOR_RE.search(selector) for selector in selectors):
+            return None
+        return cls(selectors)
+    
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Optional[Dict[str, Any]]) -> bool:
+        """최상위 요소를 트리에 포함할지 결정합니다."""
+        if name in self.tags:
+            return True
+        if not attrs:
+            return False
+        if attrs.get('id') in self.ids:
+            return True
+        classes = attrs.get('class')
+        if classes:
+            if isinstance(classes, str):
+                classes = classes.split()
+            if not self.classes.isdisjoint(classes):
+                return True
+        return not self.attributes.isdisjoint(attrs)
+    
+    def allow_string_creation(self, string: str) -> bool:
+        """최상위 텍스트는 선택자 대상이 아니므로 버립니다."""
+        return False
+
 
 class PlatformScraper(BaseScraper):
     """설정 기반 플랫폼 스크래퍼"""
     
+    # scrape_many에서 동시에 진행하는 최대 요청 수
+    MAX_CONCURRENT_SCRAPES = 20
+    
+    # requests 스크래핑용 헤더 (11번가 기준)
+    REQUEST_HEADERS: Dict[str, str] = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+        'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Referer': 'https://www.11st.co.kr/',
+        'Sec-Ch-Ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+        'Sec-Ch-Ua-Mobile': '?0',
+        'Sec-Ch-Ua-Platform': '"macOS"',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'same-origin',
+        'Sec-Fetch-User': '?1',
+        'Upgrade-Insecure-Requests': '1',
+        'Cache-Control': 'max-age=0'
+    }
+    
+    # 쿠키 설정 (필요시)
+    REQUEST_COOKIES: Dict[str, str] = {
+        # 11번가 로그인 쿠키 예시 (실제 사용 시 로그인 후 쿠키 값으로 교체)
+        # 'PCID': 'your_pcid_here',
+        # 'xecurepopup': '1',
+    }
+    
     def __init__(self, platform_name: str, config_path: Optional[str] = None):
         """
         플랫폼 스크래퍼 초기화
@@ -40,6 +400,23 @@ class PlatformScraper(BaseScraper):
         self.wait_selectors = self.config.get('wait_selectors', [])
         self.timeout = self.config.get('timeout', 10000)
         self.user_agent = self.config.get('user_agent', '')
+        
+        all_selectors = [selector for selectors in self.selectors.values() for selector in selectors]
+        if platform_name == 'naver_smartstore':
+            all_selectors += [*_NAVER_PRICE_SELECTORS, *_NAVER_ORIGINAL_PRICE_SELECTORS, *_NAVER_DISCOUNT_RATE_SELECTORS]
+        
+        # 모든 선택자를 XPath로 바꿀 수 있으면 lxml 트리에서 직접 조회
+        self._use_xpath = all(_compile_xpath(selector) is not None for selector in all_selectors)
+        
+        # Playwright 컨텍스트 (첫 scrape_with_playwright 호출 시 생성)
+        self._context: Optional[BrowserContext] = None
+        
+        # BeautifulSoup 경로: 추출에 쓰는 선택자와 관련된 요소만 파싱하도록 범위 제한
+        self._strainer = _SelectorStrainer.for_selectors(all_selectors)
+        
+        # 선택자는 초기화 시 미리 컴파일 (잘못된 선택자도 여기서 드러남)
+        for selector in all_selectors:
+            _compile_selector(selector)
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """
@@ -52,8 +429,7 @@ class PlatformScraper(BaseScraper):
             Dict[str, Any]: 설정 데이터
         """
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _load_config_cached(config_path, Path(config_path).stat().st_mtime_ns)
         except FileNotFoundError:
             self.logger.error(f"설정 파일을 찾을 수 없습니다: {config_path}")
             return {}
@@ -61,23 +437,108 @@ class PlatformScraper(BaseScraper):
             self.logger.error(f"설정 파일 파싱 오류: {e}")
             return {}
     
-    def _find_element_by_selectors(self, soup: BeautifulSoup, selector_list: List[str]) -> Optional[str]:
+    def _soup(self, html_content: str) -> BeautifulSoup:
+        """
+        BeautifulSoup으로 HTML을 파싱합니다 (XPath 조회를 쓸 수 없을 때의 대체 경로).
+        설정된 선택자와 관련된 요소만 트리로 만듭니다.
+        
+        Args:
+            html_content (str): HTML 내용
+            
+        Returns:
+            BeautifulSoup: 파싱된 HTML
+        """
+        return BeautifulSoup(html_content, _HTML_PARSER, parse_only=self._strainer)
+    
+    def _parse(self, html_content: str) -> ParsedHtml:
+        """
+        HTML을 파싱합니다. 선택자를 XPath로 조회할 수 있으면 lxml 트리를,
+        그렇지 않거나 lxml이 문서를 읽지 못하면 BeautifulSoup을 반환합니다.
+        
+        Args:
+            html_content (str): HTML 내용
+            
+        Returns:
+            ParsedHtml: 파싱된 HTML
+        """
+        if self._use_xpath:
+            try:
+                return lxml_html.fromstring(html_content)
+            except (etree.ParserError, ValueError):
+                # 빈 문서나 인코딩 선언이 포함된 문자열
+                pass
+        return self._soup(html_content)
+    
+    def _as_document(self, html_content: HtmlOrDocument) -> ParsedHtml:
+        """
+        이미 파싱된 HTML이면 그대로, 문자열이면 파싱해서 반환합니다.
+        한 페이지에서 여러 값을 추출할 때 한 번 파싱한 결과를 재사용하기 위한 어댑터입니다.
+        """
+        if isinstance(html_content, str):
+            return self._parse(html_content)
+        return html_content
+    
+    def _find_element_by_selectors(self, document: ParsedHtml, selector_list: List[str]) -> Optional[str]:
         """
         여러 선택자 중 하나로 요소를 찾습니다.
         
         Args:
-            soup (BeautifulSoup): 파싱된 HTML
+            document (ParsedHtml): 파싱된 HTML
             selector_list (List[str]): CSS 선택자 리스트
             
         Returns:
             Optional[str]: 찾은 텍스트 또는 None
         """
-        for selector in selector_list:
-            element = soup.select_one(selector)
-            if element:
-                return element.get_text().strip()
+        for _, text in self._iter_selector_texts(document, selector_list):
+            return text
         return None
     
+    def _iter_selector_texts(self, document: ParsedHtml, selector_list: List[str]) -> Iterator[Tuple[str, str]]:
+        """
+        선택자 순서대로 일치하는 첫 요소의 텍스트를 생성합니다.
+        모든 선택자 조회가 이 메서드를 거치므로 파싱/조회 방식은 여기서만 바꾸면 됩니다.
+        
+        Args:
+            document (ParsedHtml): 파싱된 HTML
+            selector_list (List[str]): CSS 선택자 리스트
+            
+        Yields:
+            Tuple[str, str]: (선택자, 공백을 제거한 요소 텍스트)
+        """
+        if isinstance(document, BeautifulSoup):
+            for selector in selector_list:
+                # 클래스/ID 단일 선택자는 CSS 엔진을 거치지 않고 find로 조회
+                lookup = _simple_lookup(selector)
+                if lookup:
+                    element = document.find(**lookup)
+                else:
+                    element = _compile_selector(selector).select_one(document)
+                if element:
+                    yield selector, element.get_text().strip()
+            return
+        
+        for selector in selector_list:
+            matches = _compile_xpath(selector)(document)
+            if matches:
+                yield selector, matches[0].text_content().strip()
+    
+    def _first_number_by_selectors(self, document: ParsedHtml, selector_list: List[str]) -> Tuple[Optional[str], float]:
+        """
+        선택자 순서대로 0보다 큰 숫자가 처음 나오는 요소를 찾습니다.
+        
+        Args:
+            document (ParsedHtml): 파싱된 HTML
+            selector_list (List[str]): CSS 선택자 리스트
+            
+        Returns:
+            Tuple[Optional[str], float]: (일치한 선택자, 추출된 숫자), 없으면 (None, 0.0)
+        """
+        for selector, text in self._iter_selector_texts(document, selector_list):
+            number = self._extract_number_from_text(text)
+            if number > 0:
+                return selector, number
+        return None, 0.0
+    
     def _extract_number_from_text(self, text: str) -> float:
         """
         텍스트에서 숫자를 추출합니다.
@@ -91,22 +552,49 @@ class PlatformScraper(BaseScraper):
         if not text:
             return 0.0
         
+        # 대부분의 가격 텍스트("19,900원")는 정규식 없이 처리
+        digits = text.strip().removesuffix('원').rstrip().replace(',', '')
+        if digits.isascii() and digits.isdigit():
+            return float(digits)
+        
         # 숫자와 쉼표만 추출
-        numbers = re.findall(r'[\d,]+', text)
-        if numbers:
+        match = _NUMBER_RE.search(text)
+        if match:
             # 쉼표 제거하고 숫자로 변환
-            number_str = numbers[0].replace(',', '')
+            number_str = match.group().replace(',', '')
             return float(number_str)
         
         return 0.0
     
-    def extract_price(self, html_content: str) -> float:
+    def _parse_rate(self, text: str) -> Optional[float]:
+        """
+        할인율 텍스트("30%", "12.5 %", "최대 30% 할인")에서 숫자를 추출합니다.
+        
+        Args:
+            text (str): 할인율 텍스트
+            
+        Returns:
+            Optional[float]: 할인율 (숫자가 없으면 None)
+        """
+        # 대부분의 할인율 텍스트("30%")는 정규식 없이 처리
+        rate = text.strip().removesuffix('%').rstrip()
+        if rate[:1].isdigit() and rate.isascii() and rate.replace('.', '', 1).isdigit():
+            return float(rate)
+        
+        # % 기호 제거하고 숫자만 추출
+        discount_match = _DECIMAL_RE.search(text)
+        if discount_match:
+            return float(discount_match.group(1))
+        
+        return None
+    
+    def extract_price(self, html_content: HtmlOrDocument) -> float:
         """
         HTML에서 가격 정보를 추출합니다.
         할인가가 있으면 할인가를, 없으면 원가를 반환합니다.
         
         Args:
-            html_content (str): HTML 내용
+            html_content (HtmlOrDocument): HTML 내용 또는 파싱된 HTML
             
         Returns:
             float: 추출된 가격 (할인가 우선)
@@ -114,36 +602,27 @@ class PlatformScraper(BaseScraper):
         Raises:
             ValueError: 가격 정보를 찾을 수 없는 경우
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        document = self._as_document(html_content)
         price_selectors = self.selectors.get('price', [])
         
         # 할인가 우선 추출 시도
-        for selector in price_selectors:
-            element = soup.select_one(selector)
-            if element:
-                price_text = element.get_text().strip()
-                price = self._extract_number_from_text(price_text)
-                if price > 0:
-                    return price
+        _, price = self._first_number_by_selectors(document, price_selectors)
+        if price > 0:
+            return price
         
         # 할인가를 찾지 못한 경우 원가에서 추출
-        original_price_selectors = self.selectors.get('original_price', [])
-        for selector in original_price_selectors:
-            element = soup.select_one(selector)
-            if element:
-                price_text = element.get_text().strip()
-                price = self._extract_number_from_text(price_text)
-                if price > 0:
-                    return price
+        _, price = self._first_number_by_selectors(document, self.selectors.get('original_price', []))
+        if price > 0:
+            return price
         
         raise ValueError(f"가격 정보를 찾을 수 없습니다. 선택자: {price_selectors}")
     
-    def extract_title(self, html_content: str) -> str:
+    def extract_title(self, html_content: HtmlOrDocument) -> str:
         """
         HTML에서 상품 제목을 추출합니다.
         
         Args:
-            html_content (str): HTML 내용
+            html_content (HtmlOrDocument): HTML 내용 또는 파싱된 HTML
             
         Returns:
             str: 추출된 상품 제목
@@ -151,129 +630,131 @@ class PlatformScraper(BaseScraper):
         Raises:
             ValueError: 제목 정보를 찾을 수 없는 경우
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        document = self._as_document(html_content)
         title_selectors = self.selectors.get('title', [])
         
-        title = self._find_element_by_selectors(soup, title_selectors)
+        title = self._find_element_by_selectors(document, title_selectors)
         if not title:
             raise ValueError(f"제목 정보를 찾을 수 없습니다. 선택자: {title_selectors}")
         
         return title
     
-    def extract_stock(self, html_content: str) -> int:
+    def extract_stock(self, html_content: HtmlOrDocument) -> int:
         """
         HTML에서 재고 정보를 추출합니다.
         
         Args:
-            html_content (str): HTML 내용
+            html_content (HtmlOrDocument): HTML 내용 또는 파싱된 HTML
             
         Returns:
             int: 추출된 재고 수량
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        document = self._as_document(html_content)
         stock_selectors = self.selectors.get('stock', [])
         
-        stock_text = self._find_element_by_selectors(soup, stock_selectors)
+        stock_text = self._find_element_by_selectors(document, stock_selectors)
         if not stock_text:
             return 0  # 재고 정보가 없으면 0 반환
         
         stock = int(self._extract_number_from_text(stock_text))
         return max(0, stock)  # 음수 방지
     
-    def extract_original_price(self, html_content: str) -> Optional[float]:
+    def extract_original_price(self, html_content: HtmlOrDocument) -> Optional[float]:
         """
         HTML에서 원가를 추출합니다.
         
         Args:
-            html_content (str): HTML 내용
+            html_content (HtmlOrDocument): HTML 내용 또는 파싱된 HTML
             
         Returns:
             Optional[float]: 원가 (없으면 None)
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
         original_price_selectors = self.selectors.get('original_price', [])
+        if not original_price_selectors:
+            # 선택자가 없는 플랫폼은 파싱하지 않음
+            return None
         
-        original_price_text = self._find_element_by_selectors(soup, original_price_selectors)
+        document = self._as_document(html_content)
+        original_price_text = self._find_element_by_selectors(document, original_price_selectors)
         if not original_price_text:
             return None
         
         original_price = self._extract_number_from_text(original_price_text)
         return original_price if original_price > 0 else None
     
-    def extract_discount_rate(self, html_content: str) -> Optional[float]:
+    def extract_discount_rate(self, html_content: HtmlOrDocument) -> Optional[float]:
         """
         HTML에서 할인율을 추출합니다.
         
         Args:
-            html_content (str): HTML 내용
+            html_content (HtmlOrDocument): HTML 내용 또는 파싱된 HTML
             
         Returns:
             Optional[float]: 할인율 (없으면 None)
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
         discount_selectors = self.selectors.get('discount_rate', [])
+        if not discount_selectors:
+            # 선택자가 없는 플랫폼은 파싱하지 않음
+            return None
         
-        discount_text = self._find_element_by_selectors(soup, discount_selectors)
+        document = self._as_document(html_content)
+        discount_text = self._find_element_by_selectors(document, discount_selectors)
         if not discount_text:
             return None
         
-        # % 기호 제거하고 숫자만 추출
-        discount_match = re.search(r'(\d+(?:\.\d+)?)', discount_text)
-        if discount_match:
-            return float(discount_match.group(1))
-        
-        return None
+        return self._parse_rate(discount_text)
     
-    def extract_max_discount_price(self, html_content: str) -> Optional[float]:
+    def extract_max_discount_price(self, html_content: HtmlOrDocument) -> Optional[float]:
         """
         HTML에서 최대 할인가를 추출합니다.
         
         Args:
-            html_content (str): HTML 내용
+            html_content (HtmlOrDocument): HTML 내용 또는 파싱된 HTML
             
         Returns:
             Optional[float]: 최대 할인가 (없으면 None)
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
         max_discount_selectors = self.selectors.get('max_discount_price', [])
+        if not max_discount_selectors:
+            # 선택자가 없는 플랫폼은 파싱하지 않음
+            return None
         
-        max_discount_text = self._find_element_by_selectors(soup, max_discount_selectors)
+        document = self._as_document(html_content)
+        max_discount_text = self._find_element_by_selectors(document, max_discount_selectors)
         if not max_discount_text:
             return None
         
         max_discount_price = self._extract_number_from_text(max_discount_text)
         return max_discount_price if max_discount_price > 0 else None
     
-    def extract_max_discount_rate(self, html_content: str) -> Optional[float]:
+    def extract_max_discount_rate(self, html_content: HtmlOrDocument) -> Optional[float]:
         """
         HTML에서 최대 할인율을 추출합니다.
         
         Args:
-            html_content (str): HTML 내용
+            html_content (HtmlOrDocument): HTML 내용 또는 파싱된 HTML
             
         Returns:
             Optional[float]: 최대 할인율 (없으면 None)
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
         max_discount_rate_selectors = self.selectors.get('max_discount_rate', [])
+        if not max_discount_rate_selectors:
+            # 선택자가 없는 플랫폼은 파싱하지 않음
+            return None
         
-        max_discount_rate_text = self._find_element_by_selectors(soup, max_discount_rate_selectors)
+        document = self._as_document(html_content)
+        max_discount_rate_text = self._find_element_by_selectors(document, max_discount_rate_selectors)
         if not max_discount_rate_text:
             return None
         
-        # % 기호 제거하고 숫자만 추출
-        discount_match = re.search(r'(\d+(?:\.\d+)?)', max_discount_rate_text)
-        if discount_match:
-            return float(discount_match.group(1))
-        
-        return None
+        return self._parse_rate(max_discount_rate_text)
     
-    def extract_discount_info(self, html_content: str) -> Dict[str, Any]:
+    def extract_discount_info(self, html_content: HtmlOrDocument) -> Dict[str, Any]:
         """
         플랫폼별 특화 할인 정보를 추출합니다.
         
         Args:
-            html_content (str): HTML 내용
+            html_content (HtmlOrDocument): HTML 내용 또는 파싱된 HTML
             
         Returns:
             Dict[str, Any]: 할인 정보
@@ -288,16 +769,17 @@ class PlatformScraper(BaseScraper):
             'discount_amount': 0
         }
         
-        # 기본 정보 추출
-        discount_info['price'] = self.extract_price(html_content)
-        discount_info['original_price'] = self.extract_original_price(html_content)
-        discount_info['discount_rate'] = self.extract_discount_rate(html_content)
-        discount_info['max_discount_price'] = self.extract_max_discount_price(html_content)
-        discount_info['max_discount_rate'] = self.extract_max_discount_rate(html_content)
+        # 기본 정보 추출 (HTML은 한 번만 파싱)
+        document = self._as_document(html_content)
+        discount_info['price'] = self.extract_price(document)
+        discount_info['original_price'] = self.extract_original_price(document)
+        discount_info['discount_rate'] = self.extract_discount_rate(document)
+        discount_info['max_discount_price'] = self.extract_max_discount_price(document)
+        discount_info['max_discount_rate'] = self.extract_max_discount_rate(document)
         
         # 네이버 스마트스토어 특화 처리
         if self.platform_name == 'naver_smartstore':
-            discount_info = self._extract_naver_discount_info(html_content, discount_info)
+            discount_info = self._extract_naver_discount_info(document, discount_info)
         
         # 할인 여부 및 할인금액 계산
         if (discount_info['original_price'] and 
@@ -317,80 +799,56 @@ class PlatformScraper(BaseScraper):
         
         return discount_info
     
-    def _extract_naver_discount_info(self, html_content: str, base_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_naver_discount_info(self, html_content: HtmlOrDocument, base_info: Dict[str, Any]) -> Dict[str, Any]:
         """
         네이버 스마트스토어 특화 할인 정보 추출
         
         Args:
-            html_content (str): HTML 내용
+            html_content (HtmlOrDocument): HTML 내용 또는 파싱된 HTML
             base_info (Dict[str, Any]): 기본 할인 정보
             
         Returns:
             Dict[str, Any]: 네이버 특화 할인 정보
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # 네이버 스마트스토어 특화 선택자들
-        naver_price_selectors = [
-            '#finalDscPrcArea .price strong .value',
-            '.price_area .sale_price strong',
-            '.price_area .final_price strong',
-            '.price_area .price strong',
-            '.price strong .value'
-        ]
-        
-        naver_original_selectors = [
-            '.price_area .original_price_area .price',
-            '.price_area .list_price',
-            '.price_area .before_price',
-            '.price_area .strike_price',
-            '.original_price strong'
-        ]
-        
-        naver_discount_selectors = [
-            '.price_area .discount_rate_area .rate',
-            '.price_area .sale_rate_area .rate',
-            '.price_area .discount_rate',
-            '.price_area .sale_rate',
-            '.discount_rate'
-        ]
+        document = self._as_document(html_content)
         
         # 할인가 우선 추출
-        for selector in naver_price_selectors:
-            element = soup.select_one(selector)
-            if element:
-                price_text = element.get_text().strip()
-                price = self._extract_number_from_text(price_text)
-                if price > 0:
-                    base_info['price'] = price
-                    self.logger.info(f"네이버 할인가 추출 ({selector}): {price:,}원")
-                    break
+        selector, price = self._first_number_by_selectors(document, _NAVER_PRICE_SELECTORS)
+        if price > 0:
+            base_info['price'] = price
+            self.logger.info(f"네이버 할인가 추출 ({selector}): {price:,}원")
         
         # 원가 추출
-        for selector in naver_original_selectors:
-            element = soup.select_one(selector)
-            if element:
-                original_text = element.get_text().strip()
-                original_price = self._extract_number_from_text(original_text)
-                if original_price > 0:
-                    base_info['original_price'] = original_price
-                    self.logger.info(f"네이버 원가 추출 ({selector}): {original_price:,}원")
-                    break
+        selector, original_price = self._first_number_by_selectors(document, _NAVER_ORIGINAL_PRICE_SELECTORS)
+        if original_price > 0:
+            base_info['original_price'] = original_price
+            self.logger.info(f"네이버 원가 추출 ({selector}): {original_price:,}원")
         
         # 할인율 추출
-        for selector in naver_discount_selectors:
-            element = soup.select_one(selector)
-            if element:
-                discount_text = element.get_text().strip()
-                discount_match = re.search(r'(\d+(?:\.\d+)?)', discount_text)
-                if discount_match:
-                    discount_rate = float(discount_match.group(1))
-                    base_info['discount_rate'] = discount_rate
-                    self.logger.info(f"네이버 할인율 추출 ({selector}): {discount_rate}%")
-                    break
+        for selector, discount_text in self._iter_selector_texts(document, _NAVER_DISCOUNT_RATE_SELECTORS):
+            discount_rate = self._parse_rate(discount_text)
+            if discount_rate is not None:
+                base_info['discount_rate'] = discount_rate
+                self.logger.info(f"네이버 할인율 추출 ({selector}): {discount_rate}%")
+                break
         
         return base_info
     
+    def _pick_texts(self, page: Page, selector_groups: Dict[str, Sequence[str]]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        그룹마다 선택자 순서대로 텍스트가 있는 첫 요소를 찾습니다.
+        모든 그룹을 한 번의 page.evaluate로 조회해 선택자마다 브라우저를 오가지 않습니다.
+        
+        Args:
+            page (Page): Playwright 페이지 객체
+            selector_groups (Dict[str, Sequence[str]]): 그룹 이름별 CSS 선택자들
+            
+        Returns:
+            Dict[str, Tuple[Optional[str], Optional[str]]]: 그룹 이름별 (선택자, 텍스트), 없으면 (None, None)
+        """
+        picked = page.evaluate(_PICK_TEXTS_JS, {key: list(selectors) for key, selectors in selector_groups.items()})
+        return {key: tuple(picked.get(key) or (None, None)) for key in selector_groups}
+    
     def _extract_naver_prices_with_playwright(self, page) -> tuple:
         """
         Playwright를 사용하여 네이버 스마트스토어 가격 정보를 추출합니다.
@@ -401,66 +859,22 @@ class PlatformScraper(BaseScraper):
         Returns:
             tuple: (price_text, original_price_text, discount_rate_text)
         """
-        price_text = None
-        original_price_text = None
-        discount_rate_text = None
+        picked = self._pick_texts(page, _NAVER_PRICE_SELECTOR_GROUPS)
         
         # 할인가 우선 시도 (네이버 스마트스토어 특화)
-        price_selectors = [
-            '#finalDscPrcArea .price strong .value',
-            '.price_area .sale_price strong',
-            '.price_area .final_price strong',
-            '.price_area .price strong',
-            '.price strong .value'
-        ]
-        
-        for selector in price_selectors:
-            try:
-                price_element = page.locator(selector).first
-                if price_element and price_element.inner_text().strip():
-                    price_text = price_element.inner_text().strip()
-                    self.logger.info(f"네이버 할인가 추출 ({selector}): {price_text}")
-                    break
-            except:
-                continue
+        selector, price_text = picked['price']
+        if price_text:
+            self.logger.info(f"네이버 할인가 추출 ({selector}): {price_text}")
         
         # 원가 추출 시도
-        original_price_selectors = [
-            '.price_area .original_price_area .price',
-            '.price_area .list_price',
-            '.price_area .before_price',
-            '.price_area .strike_price',
-            '.original_price strong'
-        ]
-        
-        for selector in original_price_selectors:
-            try:
-                original_element = page.locator(selector).first
-                if original_element and original_element.inner_text().strip():
-                    original_price_text = original_element.inner_text().strip()
-                    self.logger.info(f"네이버 원가 추출 ({selector}): {original_price_text}")
-                    break
-            except:
-                continue
+        selector, original_price_text = picked['original_price']
+        if original_price_text:
+            self.logger.info(f"네이버 원가 추출 ({selector}): {original_price_text}")
         
         # 할인율 추출 시도
-        discount_selectors = [
-            '.price_area .discount_rate_area .rate',
-            '.price_area .sale_rate_area .rate',
-            '.price_area .discount_rate',
-            '.price_area .sale_rate',
-            '.discount_rate'
-        ]
-        
-        for selector in discount_selectors:
-            try:
-                discount_element = page.locator(selector).first
-                if discount_element and discount_element.inner_text().strip():
-                    discount_rate_text = discount_element.inner_text().strip()
-                    self.logger.info(f"네이버 할인율 추출 ({selector}): {discount_rate_text}")
-                    break
-            except:
-                continue
+        selector, discount_rate_text = picked['discount_rate']
+        if discount_rate_text:
+            self.logger.info(f"네이버 할인율 추출 ({selector}): {discount_rate_text}")
         
         return price_text, original_price_text, discount_rate_text
     
@@ -474,24 +888,20 @@ class PlatformScraper(BaseScraper):
         Returns:
             tuple: (price_text, original_price_text, discount_rate_text)
         """
-        price_text = None
         original_price_text = None
         discount_rate_text = None
         
         # 일반적인 가격 추출
-        try:
-            price_element = page.locator('.price strong .value').first
-            if price_element and price_element.inner_text().strip():
-                price_text = price_element.inner_text().strip()
-                self.logger.info(f"일반 가격 추출: {price_text}")
-        except:
-            pass
+        _, price_text = self._pick_texts(page, _GENERAL_PRICE_SELECTOR_GROUPS)['price']
+        if price_text:
+            self.logger.info(f"일반 가격 추출: {price_text}")
         
         return price_text, original_price_text, discount_rate_text
     
     def get_discount_summary(self, url: str) -> Dict[str, Any]:
         """
         할인 정보 요약을 반환합니다.
+        이미 스크래핑한 결과가 있으면 다시 스크래핑하지 말고 summarize_discount를 사용하세요.
         
         Args:
             url (str): 상품 URL
@@ -500,36 +910,8 @@ class PlatformScraper(BaseScraper):
             Dict[str, Any]: 할인 정보 요약
         """
         try:
-            result = self.scrape(url)
-            
-            if result.get('status') == 'success':
-                price = result.get('price', 0)
-                original_price = result.get('original_price')
-                discount_rate = result.get('discount_rate', 0)
-                
-                summary = {
-                    'url': url,
-                    'title': result.get('title', ''),
-                    'current_price': price,
-                    'original_price': original_price,
-                    'discount_rate': discount_rate,
-                    'discount_amount': 0,
-                    'is_discounted': False,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                if original_price and price > 0:
-                    summary['discount_amount'] = original_price - price
-                    summary['is_discounted'] = original_price > price
-                
-                return summary
-            else:
-                return {
-                    'url': url,
-                    'error': result.get('error', 'Unknown error'),
-                    'timestamp': datetime.now().isoformat()
-                }
-                
+            return self.summarize_discount(url, self.scrape(url))
+            
         except Exception as e:
             self.logger.error(f"할인 정보 요약 추출 실패: {e}")
             return {
@@ -538,6 +920,159 @@ class PlatformScraper(BaseScraper):
                 'timestamp': datetime.now().isoformat()
             }
     
+    def summarize_discount(self, url: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        스크래핑 결과에서 할인 정보 요약을 만듭니다.
+        
+        Args:
+            url (str): 상품 URL
+            result (Dict[str, Any]): scrape 결과
+            
+        Returns:
+            Dict[str, Any]: 할인 정보 요약
+        """
+        if result.get('status') == 'success':
+            price = result.get('price', 0)
+            original_price = result.get('original_price')
+            discount_rate = result.get('discount_rate', 0)
+            
+            summary = {
+                'url': url,
+                'title': result.get('title', ''),
+                'current_price': price,
+                'original_price': original_price,
+                'discount_rate': discount_rate,
+                'discount_amount': 0,
+                'is_discounted': False,
+                'timestamp': datetime.now().isoformat()
+            }
+            
+            if original_price and price > 0:
+                summary['discount_amount'] = original_price - price
+                summary['is_discounted'] = original_price > price
+            
+            return summary
+        else:
+            return {
+                'url': url,
+                'error': result.get('error', 'Unknown error'),
+                'timestamp': datetime.now().isoformat()
+            }
+    
+    def _parse_bytes(self, content: bytes, declared_encoding: Optional[str]) -> ParsedHtml:
+        """
+        응답 본문 바이트를 파싱합니다. 응답 객체의 text 속성이 하는 인코딩 추측(chardet 등)을 거치지 않습니다.
+        
+        Args:
+            content (bytes): 응답 본문
+            declared_encoding (Optional[str]): 응답 헤더에 선언된 인코딩 (없으면 <meta> 선언, 그다음 UTF-8 사용)
+            
+        Returns:
+            ParsedHtml: 파싱된 HTML
+        """
+        encoding = _resolve_encoding(declared_encoding, content[:_STREAM_CHUNK_SIZE])
+        if self._use_xpath:
+            try:
+                return lxml_html.fromstring(content, parser=lxml_html.HTMLParser(encoding=encoding))
+            except (etree.ParserError, LookupError):
+                # 빈 문서나 알 수 없는 인코딩 이름
+                pass
+        return self._soup(content.decode(encoding, errors='replace'))
+    
+    def _parse_response(self, response: requests.Response) -> ParsedHtml:
+        """
+        스트리밍 응답을 내려받는 동안 lxml 파서에 조각 단위로 넣어 파싱합니다.
+        전체 본문을 문자열로 디코딩해 두지 않아도 되고, 다운로드와 파싱이 겹쳐 진행됩니다.
+        
+        Args:
+            response (requests.Response): stream=True로 요청한 응답
+            
+        Returns:
+            ParsedHtml: 파싱된 HTML
+        """
+        # 헤더에 charset이 있을 때만 그 인코딩을 사용 (requests의 text/html 기본값 ISO-8859-1은 쓰지 않음)
+        content_type = response.headers.get('Content-Type', '')
+        declared_encoding = response.encoding if 'charset' in content_type.lower() else None
+        
+        if not self._use_xpath:
+            return self._parse_bytes(response.content, declared_encoding)
+        
+        # 첫 조각에서 <meta> 선언을 확인한 뒤 파서를 만듭니다
+        chunks = response.iter_content(chunk_size=_STREAM_CHUNK_SIZE)
+        head = next(chunks, b'')
+        try:
+            parser = lxml_html.HTMLParser(encoding=_resolve_encoding(declared_encoding, head))
+        except LookupError:
+            # codecs는 알지만 lxml(libxml2)은 모르는 인코딩 이름
+            parser = lxml_html.HTMLParser(encoding='utf-8')
+        if not head:
+            # 빈 문서
+            return self._soup('')
+        parser.feed(head)
+        for chunk in chunks:
+            parser.feed(chunk)
+        try:
+            return parser.close()
+        except etree.XMLSyntaxError:
+            # 빈 문서
+            return self._soup('')
+    
+    def _build_result(self, url: str, html_content: HtmlOrDocument, timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """
+        내려받은 HTML에서 상품 정보를 추출해 결과를 만듭니다.
+        
+        Args:
+            url (str): 스크래핑한 URL
+            html_content (HtmlOrDocument): HTML 내용 또는 파싱된 HTML
+            timestamp (Optional[str]): 결과에 기록할 타임스탬프 (없으면 현재 시각)
+            
+        Returns:
+            Dict[str, Any]: 스크래핑 결과
+        """
+        document = self._as_document(html_content)
+        
+        # 데이터 추출
+        price = self.extract_price(document)
+        title = self.extract_title(document)
+        stock = self.extract_stock(document)
+        original_price = self.extract_original_price(document)
+        discount_rate = self.extract_discount_rate(document)
+        max_discount_price = self.extract_max_discount_price(document)
+        max_discount_rate = self.extract_max_discount_rate(document)
+        
+        # 할인율 계산 (직접 추출한 할인율이 없으면 계산)
+        if discount_rate is None and original_price:
+            discount_rate = self.calculate_discount_rate(price, original_price)
+        
+        result = {
+            'url': url,
+            'price': price,
+            'title': title,
+            'stock': stock,
+            'original_price': original_price,
+            'discount_rate': discount_rate or 0.0,
+            'max_discount_price': max_discount_price,
+            'max_discount_rate': max_discount_rate
+        }
+        
+        return self.format_result(result, timestamp)
+    
+    def _build_result_from_bytes(self, url: str, content: bytes, declared_encoding: Optional[str],
+                                 timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """
+        응답 본문 바이트를 파싱해 결과를 만듭니다. 파싱한 문서를 한 스레드 안에서만 사용합니다.
+        
+        Args:
+            url (str): 스크래핑한 URL
+            content (bytes): 응답 본문
+            declared_encoding (Optional[str]): 응답 헤더에 선언된 인코딩 (없으면 <meta> 선언, 그다음 UTF-8 사용)
+            timestamp (Optional[str]): 결과에 기록할 타임스탬프 (없으면 현재 시각)
+            
+        Returns:
+            Dict[str, Any]: 스크래핑 결과
+        """
+        return self._build_result(url, self._parse_bytes(content, declared_encoding), timestamp)
+    
     def scrape_with_requests(self, url: str) -> Dict[str, Any]:
         """
         requests를 사용하여 스크래핑합니다.
@@ -548,49 +1083,156 @@ class PlatformScraper(BaseScraper):
         Returns:
             Dict[str, Any]: 스크래핑 결과
         """
-        # 11번가 전용 헤더 설정
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Referer': 'https://www.11st.co.kr/',
-            'Sec-Ch-Ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-            'Sec-Ch-Ua-Mobile': '?0',
-            'Sec-Ch-Ua-Platform': '"macOS"',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'same-origin',
-            'Sec-Fetch-User': '?1',
-            'Upgrade-Insecure-Requests': '1',
-            'Cache-Control': 'max-age=0'
-        }
+        try:
+            with _SESSION.get(url, headers=self.REQUEST_HEADERS, cookies=self.REQUEST_COOKIES,
+                              timeout=15, stream=True) as response:
+                response.raise_for_status()
+                document = self._parse_response(response)
+            
+            return self._build_result(url, document)
+            
+        except requests.RequestException as e:
+            self.logger.error(f"Requests 스크래핑 실패: {e}")
+            raise
+    
+    def _get_context(self) -> BrowserContext:
+        """
+        이 스크래퍼가 재사용하는 브라우저 컨텍스트를 반환합니다.
+        처음 호출되거나 공유 브라우저가 다시 실행된 경우 새로 생성합니다.
+        """
+        browser = _get_browser()
+        if self._context is None or self._context.browser is not browser:
+            self._context = browser.new_context()
+            self._context.route('**/*', _block_heavy_resources)
+        return self._context
+    
+    def close(self) -> None:
+        """
+        이 스크래퍼의 브라우저 컨텍스트를 닫습니다.
+        공유 브라우저는 다른 스크래퍼가 계속 사용하므로 프로세스 종료 시 닫힙니다.
+        """
+        if self._context is not None:
+            self._context.close()
+            self._context = None
+    
+    def __enter__(self) -> "PlatformScraper":
+        """with 문에서 스크래퍼를 사용합니다."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """with 블록을 벗어나면 컨텍스트를 닫습니다."""
+        self.close()
+    
+    def scrape_with_playwright(self, url: str) -> Dict[str, Any]:
+        """
+        Playwright를 사용하여 동적 웹사이트를 스크래핑합니다.
         
-        # 쿠키 설정 (필요시)
-        cookies = {
-            # 11번가 로그인 쿠키 예시 (실제 사용 시 로그인 후 쿠키 값으로 교체)
-            # 'PCID': 'your_pcid_here',
-            # 'xecurepopup': '1',
-        }
+        Args:
+            url (str): 스크래핑할 URL
+            
+        Returns:
+            Dict[str, Any]: 스크래핑 결과
+        """
+        # 스크래퍼의 컨텍스트를 재사용하고 호출마다 새 페이지만 생성
+        page = self._get_context().new_page()
+        
+        # 플랫폼별 헤더 설정
+        if self.platform_name == 'naver_smartstore':
+            page.set_extra_http_headers(_NAVER_PLAYWRIGHT_HEADERS)
+        else:
+            page.set_extra_http_headers(_ELEVENST_PLAYWRIGHT_HEADERS)
         
         try:
-            response = requests.get(url, headers=headers, cookies=cookies, timeout=15)
-            response.raise_for_status()
+            # 페이지 로드 (이후 .price 셀렉터를 직접 기다리므로 DOM 로드까지만 대기)
+            self.logger.info(f"페이지 로딩 중: {url}")
+            page.goto(url, wait_until='domcontentloaded', timeout=self.timeout)
+            
+            # .price 셀렉터가 로드될 때까지 대기
+            self.logger.info("가격 정보 로딩 대기 중...")
+            try:
+                page.wait_for_selector('.price', timeout=10000)
+                self.logger.info("✅ .price 셀렉터 로드 완료")
+            except Exception as e:
+                self.logger.warning(f"⚠️ .price 셀렉터 대기 실패: {e}")
+            
+            # 추가 대기 (동적 콘텐츠 로드 대기)
+            page.wait_for_timeout(3000)
             
-            html_content = response.text
+            # 필요한 요소들이 로드될 때까지 대기
+            for selector in self.wait_selectors:
+                try:
+                    page.wait_for_selector(selector, timeout=5000)
+                    self.logger.info(f"✅ {selector} 로드 완료")
+                except PlaywrightError:
+                    self.logger.warning(f"⚠️ {selector} 로드 실패")
             
-            # 데이터 추출
-            price = self.extract_price(html_content)
-            title = self.extract_title(html_content)
-            stock = self.extract_stock(html_content)
-            original_price = self.extract_original_price(html_content)
-            discount_rate = self.extract_discount_rate(html_content)
-            max_discount_price = self.extract_max_discount_price(html_content)
-            max_discount_rate = self.extract_max_discount_rate(html_content)
+            # 플랫폼별 특화 가격 추출 로직
+            price_text = None
+            original_price_text = None
+            discount_rate_text = None
             
-            # 할인율 계산 (직접 추출한 할인율이 없으면 계산)
-            if discount_rate is None and original_price:
-                discount_rate = self.calculate_discount_rate(price, original_price)
+            try:
+                if self.platform_name == 'naver_smartstore':
+                    # 네이버 스마트스토어 특화 가격 추출
+                    price_text, original_price_text, discount_rate_text = self._extract_naver_prices_with_playwright(page)
+                else:
+                    # 일반적인 가격 추출
+                    price_text, original_price_text, discount_rate_text = self._extract_general_prices_with_playwright(page)
+                        
+            except Exception as e:
+                self.logger.warning(f"가격 정보 직접 추출 실패: {e}")
+            
+            # HTML 내용 가져오기
+            html_content = page.content()
+            document = self._parse(html_content)
+            
+            price = None
+            original_price = None
+            discount_rate = None
+            
+            # Playwright로 직접 추출한 값들을 우선 사용
+            if price_text:
+                try:
+                    price_from_innertext = self._extract_number_from_text(price_text)
+                    if price_from_innertext > 0:
+                        price = price_from_innertext
+                        self.logger.info(f"Playwright 할인가 사용: {price}")
+                except ValueError:
+                    pass
+            
+            if original_price_text:
+                try:
+                    original_from_innertext = self._extract_number_from_text(original_price_text)
+                    if original_from_innertext > 0:
+                        original_price = original_from_innertext
+                        self.logger.info(f"Playwright 원가 사용: {original_price}")
+                except ValueError:
+                    pass
+            
+            if discount_rate_text:
+                rate_from_innertext = self._parse_rate(discount_rate_text)
+                if rate_from_innertext is not None:
+                    discount_rate = rate_from_innertext
+                    self.logger.info(f"Playwright 할인율 사용: {discount_rate}%")
+            
+            # 데이터 추출 (HTML 파싱) - Playwright로 얻지 못한 가격 정보만 추출
+            if price is None:
+                price = self.extract_price(document)
+            if original_price is None:
+                original_price = self.extract_original_price(document)
+            if discount_rate is None:
+                discount_rate = self.extract_discount_rate(document)
+            title = self.extract_title(document)
+            stock = self.extract_stock(document)
+            max_discount_price = self.extract_max_discount_price(document)
+            max_discount_rate = self.extract_max_discount_rate(document)
+            
+            # 할인율이 없고 원가가 있으면 계산
+            if discount_rate is None and original_price and price > 0:
+                calculated_discount_rate = self.calculate_discount_rate(price, original_price)
+                if calculated_discount_rate > 0:
+                    discount_rate = calculated_discount_rate
+                    self.logger.info(f"할인율 계산: {discount_rate}%")
             
             result = {
                 'url': url,
@@ -605,174 +1247,123 @@ class PlatformScraper(BaseScraper):
             
             return self.format_result(result)
             
-        except requests.RequestException as e:
-            self.logger.error(f"Requests 스크래핑 실패: {e}")
+        except Exception as e:
+            self.logger.error(f"Playwright 스크래핑 실패: {e}")
             raise
+        finally:
+            page.close()
     
-    def scrape_with_playwright(self, url: str) -> Dict[str, Any]:
+    def scrape(self, url: str, use_playwright: bool = True) -> Dict[str, Any]:
         """
-        Playwright를 사용하여 동적 웹사이트를 스크래핑합니다.
+        URL을 스크래핑합니다.
         
         Args:
             url (str): 스크래핑할 URL
+            use_playwright (bool): Playwright 사용 여부
             
         Returns:
             Dict[str, Any]: 스크래핑 결과
         """
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            
-            # 플랫폼별 헤더 설정
-            if self.platform_name == 'naver_smartstore':
-                page.set_extra_http_headers({
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                    'Referer': 'https://smartstore.naver.com/'
-                })
+        try:
+            if use_playwright:
+                result = self.scrape_with_playwright(url)
             else:
-                # 11번가 전용 헤더 설정
-                page.set_extra_http_headers({
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                    'Referer': 'https://www.11st.co.kr/'
-                })
+                result = self.scrape_with_requests(url)
             
-            try:
-                # 페이지 로드
-                self.logger.info(f"페이지 로딩 중: {url}")
-                page.goto(url, wait_until='networkidle', timeout=self.timeout)
-                
-                # .price 셀렉터가 로드될 때까지 대기
-                self.logger.info("가격 정보 로딩 대기 중...")
-                try:
-                    page.wait_for_selector('.price', timeout=10000)
-                    self.logger.info("✅ .price 셀렉터 로드 완료")
-                except Exception as e:
-                    self.logger.warning(f"⚠️ .price 셀렉터 대기 실패: {e}")
-                
-                # 추가 대기 (동적 콘텐츠 로드 대기)
-                page.wait_for_timeout(3000)
-                
-                # 필요한 요소들이 로드될 때까지 대기
-                for selector in self.wait_selectors:
-                    try:
-                        page.wait_for_selector(selector, timeout=5000)
-                        self.logger.info(f"✅ {selector} 로드 완료")
-                    except:
-                        self.logger.warning(f"⚠️ {selector} 로드 실패")
-                
-                # 플랫폼별 특화 가격 추출 로직
-                price_text = None
-                original_price_text = None
-                discount_rate_text = None
-                
-                try:
-                    if self.platform_name == 'naver_smartstore':
-                        # 네이버 스마트스토어 특화 가격 추출
-                        price_text, original_price_text, discount_rate_text = self._extract_naver_prices_with_playwright(page)
-                    else:
-                        # 일반적인 가격 추출
-                        price_text, original_price_text, discount_rate_text = self._extract_general_prices_with_playwright(page)
-                            
-                except Exception as e:
-                    self.logger.warning(f"가격 정보 직접 추출 실패: {e}")
-                
-                # HTML 내용 가져오기
-                html_content = page.content()
-                
-                # 데이터 추출 (HTML 파싱)
-                price = self.extract_price(html_content)
-                title = self.extract_title(html_content)
-                stock = self.extract_stock(html_content)
-                original_price = self.extract_original_price(html_content)
-                discount_rate = self.extract_discount_rate(html_content)
-                max_discount_price = self.extract_max_discount_price(html_content)
-                max_discount_rate = self.extract_max_discount_rate(html_content)
-                
-                # Playwright로 직접 추출한 값들로 우선 교체
-                if price_text:
-                    try:
-                        price_from_innertext = float(price_text.replace(',', ''))
-                        if price_from_innertext > 0:
-                            price = price_from_innertext
-                            self.logger.info(f"Playwright 할인가 사용: {price}")
-                    except:
-                        pass
-                
-                if original_price_text:
-                    try:
-                        original_from_innertext = float(original_price_text.replace(',', ''))
-                        if original_from_innertext > 0:
-                            original_price = original_from_innertext
-                            self.logger.info(f"Playwright 원가 사용: {original_price}")
-                    except:
-                        pass
-                
-                if discount_rate_text:
-                    try:
-                        # % 기호 제거하고 숫자만 추출
-                        discount_match = re.search(r'(\d+(?:\.\d+)?)', discount_rate_text)
-                        if discount_match:
-                            discount_rate = float(discount_match.group(1))
-                            self.logger.info(f"Playwright 할인율 사용: {discount_rate}%")
-                    except:
-                        pass
-                
-                # 할인율이 없고 원가가 있으면 계산
-                if discount_rate is None and original_price and price > 0:
-                    calculated_discount_rate = self.calculate_discount_rate(price, original_price)
-                    if calculated_discount_rate > 0:
-                        discount_rate = calculated_discount_rate
-                        self.logger.info(f"할인율 계산: {discount_rate}%")
-                
-                result = {
-                    'url': url,
-                    'price': price,
-                    'title': title,
-                    'stock': stock,
-                    'original_price': original_price,
-                    'discount_rate': discount_rate or 0.0,
-                    'max_discount_price': max_discount_price,
-                    'max_discount_rate': max_discount_rate
-                }
-                
-                return self.format_result(result)
-                
-            except Exception as e:
-                self.logger.error(f"Playwright 스크래핑 실패: {e}")
-                raise
-            finally:
-                browser.close()
+            self.log_scraping_result(url, result)
+            return result
+            
+        except Exception as e:
+            return self._error_result(url, e)
     
-    def scrape(self, url: str, use_playwright: bool = True) -> Dict[str, Any]:
+    def _error_result(self, url: str, error: Exception) -> Dict[str, Any]:
         """
-        URL을 스크래핑합니다.
+        스크래핑 실패 결과를 만듭니다.
+        
+        Args:
+            url (str): 스크래핑한 URL
+            error (Exception): 발생한 예외
+            
+        Returns:
+            Dict[str, Any]: 오류 결과
+        """
+        self.logger.error(f"스크래핑 실패: {error}")
+        return {
+            'platform': self.platform_name,
+            'timestamp': datetime.now().isoformat(),
+            'url': url,
+            'status': 'error',
+            'error': str(error)
+        }
+    
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        비동기 스크래핑에 사용할 HTTP 클라이언트를 생성합니다.
+        여러 URL을 동시에 스크래핑할 때는 하나의 클라이언트를 만들어 공유하세요.
+        
+        Returns:
+            httpx.AsyncClient: 요청 헤더와 쿠키가 설정된 비동기 클라이언트
+        """
+        return httpx.AsyncClient(
+            headers=self.REQUEST_HEADERS,
+            cookies=self.REQUEST_COOKIES,
+            timeout=15,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.MAX_CONCURRENT_SCRAPES)
+        )
+    
+    async def scrape_async(self, url: str, client: Optional[httpx.AsyncClient] = None,
+                           timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """
+        URL을 비동기로 스크래핑합니다 (requests 경로와 같은 결과 형식).
+        Playwright sync API는 생성한 스레드에 묶여 있으므로 동적 페이지는 scrape를 사용하세요.
         
         Args:
             url (str): 스크래핑할 URL
-            use_playwright (bool): Playwright 사용 여부
+            client (Optional[httpx.AsyncClient]): 공유할 비동기 클라이언트 (없으면 새로 생성)
+            timestamp (Optional[str]): 결과에 기록할 타임스탬프 (없으면 현재 시각)
             
         Returns:
             Dict[str, Any]: 스크래핑 결과
         """
         try:
-            if use_playwright:
-                result = self.scrape_with_playwright(url)
+            if client is None:
+                async with self.async_client() as own_client:
+                    response = await own_client.get(url)
             else:
-                result = self.scrape_with_requests(url)
+                response = await client.get(url)
+            response.raise_for_status()
             
+            # 파싱과 추출은 CPU 작업이므로 스레드에서 실행해 다른 요청이 이벤트 루프에서 기다리지 않게 합니다
+            result = await asyncio.to_thread(
+                self._build_result_from_bytes, url, response.content, response.charset_encoding, timestamp
+            )
             self.log_scraping_result(url, result)
             return result
             
         except Exception as e:
-            self.logger.error(f"스크래핑 실패: {e}")
-            return {
-                'platform': self.platform_name,
-                'timestamp': datetime.now().isoformat(),
-                'url': url,
-                'status': 'error',
-                'error': str(e)
-            } 
\ No newline at end of file
+            return self._error_result(url, e)
+    
+    async def scrape_many(self, urls: List[str], concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        여러 URL을 하나의 클라이언트로 동시에 스크래핑합니다.
+        
+        Args:
+            urls (List[str]): 스크래핑할 URL 목록
+            concurrency (Optional[int]): 동시에 진행할 요청 수 (기본값: MAX_CONCURRENT_SCRAPES)
+            
+        Returns:
+            List[Dict[str, Any]]: URL 순서대로 정렬된 스크래핑 결과
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.MAX_CONCURRENT_SCRAPES)
+        # 한 번의 일괄 요청에 속한 결과는 같은 타임스탬프를 공유
+        timestamp = self.current_timestamp()
+        
+        async with self.async_client() as client:
+            async def scrape_with_slot(url: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.scrape_async(url, client=client, timestamp=timestamp)
+            
+            results = await asyncio.gather(*(scrape_with_slot(url) for url in urls))
+        
+        return list(results)
@@ -1,14 +1,161 @@
 """
 Seller labeling utilities for categorizing sellers based on rules.
 """
+import logging
+import os
 import re
+from functools import lru_cache
+import numpy as np
+import pandas as pd
 import yaml
-from typing import Dict, Literal, Optional
+from typing import Callable, Dict, List, Literal, Optional
+
+logger = logging.getLogger(__name__)
+
+# Pattern lookup used while labeling; already compiled patterns are returned as-is
+_as_pattern = lru_cache(maxsize=None)(re.compile)
+
+
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """
+    Compile a single rule pattern, falling back to a literal match if it is invalid.
+    
+    Args:
+        pattern: Regular expression from the rules file
+        
+    Returns:
+        Compiled pattern
+    """
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        logger.warning(f"Invalid seller rule pattern {pattern!r} ({e}); matching it literally")
+        return re.compile(re.escape(pattern))
+
+
+# Backreferences refer to group numbers/names that change once patterns are joined
+_BACKREFERENCE_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+
+def _fuse_patterns(patterns: List[re.Pattern]) -> Optional[re.Pattern]:
+    """
+    Join a category's patterns into one alternation so a name is scanned once.
+    
+    Args:
+        patterns: Compiled patterns of one category
+        
+    Returns:
+        Fused pattern, or None if there are no patterns or they cannot be joined safely
+    """
+    if not patterns or any(_BACKREFERENCE_RE.search(p.pattern) for p in patterns):
+        return None
+    try:
+        return re.compile('|'.join(f'(?:{p.pattern})' for p in patterns))
+    except re.error:
+        # e.g. global inline flags that are only valid at the start of a pattern
+        return None
+
+
+# Literal text a pattern must end with, e.g. "공식스토어" in "^.+공식스토어$"
+_LITERAL_TAIL_RE = re.compile(r'(\w+)\$\Z')
+
+
+def _literal_tails(patterns: List[re.Pattern]) -> Optional[tuple]:
+    """
+    Collect the literal endings that every pattern of a category is anchored to.
+    
+    Args:
+        patterns: Compiled patterns of one category
+        
+    Returns:
+        Tuple of suffixes for ``str.endswith`` (a name that ends with none of them
+        cannot match), or None if any pattern is not of that form
+        
+    Examples:
+        >>> _literal_tails([re.compile('^.+공식스토어$')])
+        ('공식스토어', '공식스토어\\n')
+        >>> _literal_tails([re.compile('^.+공식스토어$'), re.compile('쿠팡')]) is None
+        True
+        >>> _literal_tails([re.compile('\\\\x41$')]) is None
+        True
+        >>> label_seller('XA', compile_rules({'official': {'regex': ['\\\\x41$']}}))
+        'official'
+    """
+    tails = []
+    for pattern in patterns:
+        # Escapes such as "\x41" or "\101" are not literal text of the pattern
+        if ('|' in pattern.pattern or '\\' in pattern.pattern
+                or pattern.flags & (re.IGNORECASE | re.MULTILINE | re.VERBOSE)):
+            return None
+        match = _LITERAL_TAIL_RE.search(pattern.pattern)
+        if match is None:
+            return None
+        # "$" also matches right before a trailing newline
+        tails += [match.group(1), match.group(1) + '\n']
+    return tuple(tails) or None
+
+
+def _search_section(section: dict, mall_name: str) -> bool:
+    """
+    Check whether any regex pattern of a category matches the mall name.
+    
+    Args:
+        section: One category of the rules dictionary
+        mall_name: Name of the mall/seller
+        
+    Returns:
+        True if a pattern matches
+    """
+    tails = section.get('regex_tails')
+    if tails is not None and not mall_name.endswith(tails):
+        return False
+    fused = section.get('regex_union')
+    if fused is not None:
+        return fused.search(mall_name) is not None
+    return any(_as_pattern(pattern).search(mall_name) for pattern in section.get('regex', ()))
+
+
+def compile_rules(rules: dict) -> dict:
+    """
+    Prepare a rules dictionary for labeling: exact names become a set and regex
+    patterns are compiled once instead of being looked up in the ``re`` cache per call.
+    
+    Args:
+        rules: Dictionary with seller categorization rules
+        
+    Returns:
+        Copy of the rules whose ``exact`` lists are frozensets and whose ``regex`` lists
+        hold compiled patterns, plus a ``regex_union`` pattern per category that matches
+        any of them in one scan and the ``regex_tails`` every match must end with
+        
+    Examples:
+        >>> compiled = compile_rules({'official': {'exact': ['올리브영']}, 'reseller': {'regex': ['쿠팡', '(']}})
+        >>> compiled['official']['exact']
+        frozenset({'올리브영'})
+        >>> compiled['reseller']['regex'][0].pattern
+        '쿠팡'
+        >>> bool(compiled['reseller']['regex'][1].search('a(b'))
+        True
+        >>> compiled['reseller']['regex_union'].search('쿠팡 스토어').group()
+        '쿠팡'
+    """
+    compiled = {}
+    for category, section in rules.items():
+        section = dict(section or {})
+        if 'exact' in section:
+            section['exact'] = frozenset(str(name) for name in section['exact'] or ())
+        if 'regex' in section:
+            section['regex'] = [_compile_pattern(pattern) for pattern in section['regex']]
+            section['regex_union'] = _fuse_patterns(section['regex'])
+            section['regex_tails'] = _literal_tails(section['regex'])
+        compiled[category] = section
+    return compiled
 
 
 def load_rules(path: str = "config/seller_rules.yaml") -> dict:
     """
-    Load seller categorization rules from YAML file.
+    Load seller categorization rules from YAML file, with regex patterns pre-compiled.
+    Repeated loads of an unchanged file reuse the parsed rules.
     
     Args:
         path: Path to YAML file containing rules
@@ -35,12 +182,39 @@ def load_rules(path: str = "config/seller_rules.yaml") -> dict:
         True
         >>> os.remove('test_rules.yaml')
     """
+    return _load_rules_cached(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_rules_cached(path: str, mtime_ns: int) -> dict:
+    """
+    Parse and compile a rules file. ``(path, mtime_ns)`` is the cache key, so an
+    edited file is read again; the returned rules are shared and must not be modified.
+    """
     with open(path, 'r', encoding='utf-8') as f:
         rules = yaml.safe_load(f)
-    return rules
+    return compile_rules(rules)
+
+
+@lru_cache(maxsize=4)
+def get_rules(path: str = "config/seller_rules.yaml") -> dict:
+    """
+    Return the seller rules of a file, loading them on first use only.
+    
+    Preferred entry point for long-lived processes and workers that share one
+    rules file. Unlike ``load_rules`` the file is not checked for changes after
+    the first call; use ``load_rules`` to pick up edits.
+    
+    Args:
+        path: Path to YAML file containing rules
+        
+    Returns:
+        Shared dictionary with seller categorization rules (must not be modified)
+    """
+    return load_rules(path)
 
 
-def label_seller(mall_name: str, rules: dict) -> Literal["official", "reseller", "suspect"]:
+def label_seller(mall_name: Optional[str], rules: dict) -> Literal["official", "reseller", "suspect"]:
     """
     Label a seller based on mall name and categorization rules.
     
@@ -90,27 +264,156 @@ def label_seller(mall_name: str, rules: dict) -> Literal["official", "reseller",
             return "official"
         
         # Check regex patterns
-        if 'regex' in rules['official']:
-            for pattern in rules['official']['regex']:
-                if re.search(pattern, mall_name):
-                    return "official"
+        if _search_section(rules['official'], mall_name):
+            return "official"
     
     # Check reseller
-    if 'reseller' in rules and 'regex' in rules['reseller']:
-        for pattern in rules['reseller']['regex']:
-            if re.search(pattern, mall_name):
-                return "reseller"
+    if 'reseller' in rules and _search_section(rules['reseller'], mall_name):
+        return "reseller"
     
     # Check suspect patterns
-    if 'suspect' in rules and 'regex' in rules['suspect']:
-        for pattern in rules['suspect']['regex']:
-            if re.search(pattern, mall_name):
-                return "suspect"
+    if 'suspect' in rules and _search_section(rules['suspect'], mall_name):
+        return "suspect"
     
     # Default to suspect if no match
     return "suspect"
 
 
+def _section_searcher(section: Optional[dict]) -> Optional[Callable[[str], object]]:
+    """
+    Return a callable that is truthy when a regex pattern of the category matches.
+    
+    Args:
+        section: One category of compiled rules, or None
+        
+    Returns:
+        Bound ``search`` of the fused pattern (behind a ``str.endswith`` check when
+        the category has literal tails), a fallback over the individual patterns,
+        or None if the category has no patterns
+    """
+    if not section:
+        return None
+    fused = section.get('regex_union')
+    patterns = section.get('regex')
+    if fused is None and not patterns:
+        return None
+    search = fused.search if fused is not None else (
+        lambda mall_name: any(pattern.search(mall_name) for pattern in patterns)
+    )
+    tails = section.get('regex_tails')
+    if tails is None:
+        return search
+    # Names without one of the literal endings skip the regex scan
+    return lambda mall_name: mall_name.endswith(tails) and search(mall_name)
+
+
+def make_labeler(rules: dict) -> Callable[[Optional[str]], Literal["official", "reseller", "suspect"]]:
+    """
+    Build a ``label_seller`` specialized to one set of rules.
+    
+    The exact names and matchers are bound to the returned function once, so
+    labeling a name does no dictionary lookups. The suspect patterns are not
+    checked because an unmatched name is labeled "suspect" anyway.
+    
+    Args:
+        rules: Dictionary containing categorization rules
+        
+    Returns:
+        Function mapping a mall name to its category label
+        
+    Examples:
+        >>> labeler = make_labeler({
+        ...     'official': {'exact': ['올리브영'], 'regex': ['^.+공식스토어$']},
+        ...     'reseller': {'regex': ['쿠팡']},
+        ...     'suspect': {'regex': ['병행']}
+        ... })
+        >>> [labeler(name) for name in ['올리브영', '네이처공식스토어', '쿠팡', '병행수입', None]]
+        ['official', 'official', 'reseller', 'suspect', 'suspect']
+    """
+    rules = compile_rules(rules)
+    official = rules.get('official') or {}
+    official_exact = official.get('exact', frozenset())
+    official_search = _section_searcher(official)
+    reseller_search = _section_searcher(rules.get('reseller'))
+    
+    def labeler(mall_name: Optional[str]) -> Literal["official", "reseller", "suspect"]:
+        if not mall_name:
+            return "suspect"
+        if mall_name in official_exact:
+            return "official"
+        if official_search is not None and official_search(mall_name):
+            return "official"
+        if reseller_search is not None and reseller_search(mall_name):
+            return "reseller"
+        return "suspect"
+    
+    return labeler
+
+
+def _category_mask(names: pd.Series, section: dict) -> np.ndarray:
+    """
+    Vectorized regex check of one category over a series of mall names.
+    
+    Args:
+        names: Mall names (strings, no missing values)
+        section: One category of compiled rules
+        
+    Returns:
+        Boolean array, True where a pattern of the category matches
+    """
+    fused = section.get('regex_union')
+    if fused is not None:
+        return names.str.contains(fused, regex=True).to_numpy(dtype=bool)
+    mask = np.zeros(len(names), dtype=bool)
+    for pattern in section.get('regex', ()):
+        mask |= names.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+    return mask
+
+
+def label_sellers(mall_names: pd.Series, rules: dict) -> pd.Series:
+    """
+    Label many sellers at once. Same result as calling ``label_seller`` per name,
+    but the matching runs column-wise in pandas instead of once per row.
+    
+    Args:
+        mall_names: Series of mall/seller names
+        rules: Dictionary containing categorization rules
+        
+    Returns:
+        Series of category labels with the same index as ``mall_names``
+        
+    Examples:
+        >>> rules = {
+        ...     'official': {'exact': ['올리브영'], 'regex': ['^.+공식스토어$']},
+        ...     'reseller': {'regex': ['쿠팡']},
+        ...     'suspect': {'regex': ['병행']}
+        ... }
+        >>> label_sellers(pd.Series(['올리브영', '쿠팡', '병행수입', None, '네이처공식스토어']), rules).tolist()
+        ['official', 'reseller', 'suspect', 'suspect', 'official']
+    """
+    rules = compile_rules(rules)
+    names = mall_names.fillna('').astype(str)
+    has_name = (names != '').to_numpy()
+    
+    # Check official sellers first (highest priority)
+    official = np.zeros(len(names), dtype=bool)
+    if 'official' in rules:
+        if 'exact' in rules['official']:
+            official |= names.isin(rules['official']['exact']).to_numpy()
+        official |= _category_mask(names, rules['official'])
+    official &= has_name
+    
+    # Check reseller among the rest; everything else is "suspect"
+    reseller = np.zeros(len(names), dtype=bool)
+    if 'reseller' in rules:
+        reseller = _category_mask(names, rules['reseller']) & has_name & ~official
+    
+    labels = np.full(len(names), 'suspect', dtype=object)
+    labels[official] = 'official'
+    labels[reseller] = 'reseller'
+    return pd.Series(labels, index=mall_names.index, name=mall_names.name)
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
\ No newline at end of file
@@ -3,21 +3,95 @@
 여러 플랫폼의 가격을 비교하고 최적의 할인율을 찾는 기능을 제공합니다.
 """
 
+from collections.abc import Sequence
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-import json
 from pathlib import Path
+import heapq
 import logging
 
+import numpy as np
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# 수치 컬럼 버퍼의 초기 크기 (가득 차면 두 배로 늘립니다)
+_INITIAL_CAPACITY = 16
+
+
+def _as_float(value: Any, default: float) -> float:
+    """
+    결과 값을 수치 컬럼에 넣을 float 로 변환합니다.
+
+    Args:
+        value (Any): 결과 dict 의 값 (None 가능)
+        default (float): 값이 없을 때 사용할 기본값
+
+    Returns:
+        float: 변환된 값
+    """
+    return default if value is None else float(value)
+
+
+class _ResultsView(Sequence):
+    """결과 리스트를 복사하지 않고 감싸는 읽기 전용 시퀀스"""
+    
+    __slots__ = ('_rows',)
+    
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self._rows = rows
+    
+    def __getitem__(self, index):
+        return self._rows[index]
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def __iter__(self):
+        return iter(self._rows)
+    
+    def __repr__(self) -> str:
+        return repr(self._rows)
+
 
 class PriceAnalyzer:
     """가격 분석 및 할인율 계산 클래스"""
     
     def __init__(self):
         """가격 분석기 초기화"""
-        self.results = []
+        # 결과 목록은 add_result / clear_results 로만 바꿔 수치 컬럼과 항상 맞춥니다
+        self._results = []
+        self._results_view = _ResultsView(self._results)
+        # 조회용 수치 컬럼 (_results 와 같은 순서, 앞 len(_results) 개만 유효)
+        self._prices = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._discount_rates = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+    
+    @property
+    def results(self) -> Sequence:
+        """
+        추가된 스크래핑 결과 (읽기 전용, 복사 없이 내부 목록을 보여줍니다).
+        결과 추가/초기화는 add_result / clear_results 를 사용하세요.
+        
+        Returns:
+            Sequence: 추가된 순서의 결과 목록
+        """
+        return self._results_view
+    
+    def _append_columns(self, result: Dict[str, Any]):
+        """
+        결과의 가격/할인율을 수치 컬럼 끝에 추가합니다.
+        
+        Args:
+            result (Dict[str, Any]): 스크래핑 결과
+        """
+        size = len(self._results)
+        if size == self._prices.size:
+            # 버퍼가 가득 차면 두 배로 늘려 추가 비용을 상각합니다
+            self._prices = np.concatenate([self._prices, np.empty_like(self._prices)])
+            self._discount_rates = np.concatenate([self._discount_rates, np.empty_like(self._discount_rates)])
+        
+        self._prices[size] = _as_float(result.get('price'), float('inf'))
+        self._discount_rates[size] = _as_float(result.get('discount_rate'), 0.0)
     
     def add_result(self, result: Dict[str, Any]):
         """
@@ -27,7 +101,8 @@ class PriceAnalyzer:
             result (Dict[str, Any]): 스크래핑 결과
         """
         if result.get('status') == 'success':
-            self.results.append(result)
+            self._append_columns(result)
+            self._results.append(result)
             logger.info(f"결과 추가: {result.get('platform')} - {result.get('price'):,}원")
     
     def get_best_price(self) -> Optional[Dict[str, Any]]:
@@ -37,10 +112,10 @@ class PriceAnalyzer:
         Returns:
             Optional[Dict[str, Any]]: 최저가 상품 정보
         """
-        if not self.results:
+        if not self._results:
             return None
         
-        return min(self.results, key=lambda x: x.get('price', float('inf')))
+        return self._results[int(self._prices[:len(self._results)].argmin())]
     
     def get_highest_discount(self) -> Optional[Dict[str, Any]]:
         """
@@ -49,10 +124,37 @@ class PriceAnalyzer:
         Returns:
             Optional[Dict[str, Any]]: 최고 할인율 상품 정보
         """
-        if not self.results:
+        if not self._results:
             return None
         
-        return max(self.results, key=lambda x: x.get('discount_rate', 0))
+        return self._results[int(self._discount_rates[:len(self._results)].argmax())]
+    
+    def get_top_cheapest(self, k: int = 3) -> List[Dict[str, Any]]:
+        """
+        가격이 낮은 순으로 상위 k개 상품을 반환합니다.
+        
+        Args:
+            k (int): 반환할 상품 수
+            
+        Returns:
+            List[Dict[str, Any]]: 최저가 순 상품 목록 (같은 가격은 추가된 순서)
+        """
+        # 전체 정렬 대신 크기 k 의 힙으로 고릅니다 (O(N log k))
+        prices = self._prices[:len(self._results)].tolist()
+        return [self._results[i] for i in heapq.nsmallest(k, range(len(prices)), key=prices.__getitem__)]
+    
+    def get_top_discounts(self, k: int = 3) -> List[Dict[str, Any]]:
+        """
+        할인율이 높은 순으로 상위 k개 상품을 반환합니다.
+        
+        Args:
+            k (int): 반환할 상품 수
+            
+        Returns:
+            List[Dict[str, Any]]: 할인율 순 상품 목록 (같은 할인율은 추가된 순서)
+        """
+        discount_rates = self._discount_rates[:len(self._results)].tolist()
+        return [self._results[i] for i in heapq.nlargest(k, range(len(discount_rates)), key=discount_rates.__getitem__)]
     
     def get_platform_comparison(self) -> Dict[str, Any]:
         """
@@ -61,25 +163,28 @@ class PriceAnalyzer:
         Returns:
             Dict[str, Any]: 플랫폼별 비교 결과
         """
-        if not self.results:
+        if not self._results:
             return {}
         
+        # 최저가/최고 할인율은 수치 컬럼에서 바로 구하고, results 는 한 번만 순회합니다
+        size = len(self._results)
+        platforms = {}
         comparison = {
-            'total_platforms': len(self.results),
-            'best_price': self.get_best_price(),
-            'highest_discount': self.get_highest_discount(),
-            'platforms': {}
+            'total_platforms': size,
+            'best_price': self._results[int(self._prices[:size].argmin())],
+            'highest_discount': self._results[int(self._discount_rates[:size].argmax())],
+            'platforms': platforms
         }
         
-        for result in self.results:
-            platform = result.get('platform', 'unknown')
-            comparison['platforms'][platform] = {
-                'price': result.get('price', 0),
-                'discount_rate': result.get('discount_rate', 0),
-                'original_price': result.get('original_price'),
-                'stock': result.get('stock', 0),
-                'url': result.get('url', ''),
-                'timestamp': result.get('timestamp', '')
+        for result in self._results:
+            get = result.get
+            platforms[get('platform', 'unknown')] = {
+                'price': get('price', 0),
+                'discount_rate': get('discount_rate', 0),
+                'original_price': get('original_price'),
+                'stock': get('stock', 0),
+                'url': get('url', ''),
+                'timestamp': get('timestamp', '')
             }
         
         return comparison
@@ -94,22 +199,23 @@ class PriceAnalyzer:
         Returns:
             Dict[str, Any]: 절약 정보
         """
-        if not self.results:
+        if not self._results:
             return {}
         
+        platforms = {}
         savings_info = {
             'target_price': target_price,
-            'platforms': {}
+            'platforms': platforms
         }
         
-        for result in self.results:
-            platform = result.get('platform', 'unknown')
-            current_price = result.get('price', 0)
+        for result in self._results:
+            get = result.get
+            current_price = get('price', 0)
             
             savings = target_price - current_price
             savings_percentage = (savings / target_price * 100) if target_price > 0 else 0
             
-            savings_info['platforms'][platform] = {
+            platforms[get('platform', 'unknown')] = {
                 'current_price': current_price,
                 'savings_amount': savings,
                 'savings_percentage': round(savings_percentage, 2),
@@ -131,7 +237,7 @@ class PriceAnalyzer:
         """
         # TODO: 데이터베이스 연동하여 실제 가격 이력 조회
         # 현재는 메모리상의 결과만 반환
-        return [r for r in self.results if r.get('platform') == platform]
+        return [r for r in self._results if r.get('platform') == platform]
     
     def export_comparison(self, filepath: str, format: str = 'json'):
         """
@@ -144,30 +250,36 @@ class PriceAnalyzer:
         comparison = self.get_platform_comparison()
         
         if format.lower() == 'json':
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(comparison, f, ensure_ascii=False, indent=2)
+            Path(filepath).write_bytes(orjson.dumps(
+                comparison, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ))
         elif format.lower() == 'csv':
             # CSV 형식으로 내보내기
             import csv
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 writer.writerow(['Platform', 'Price', 'Discount Rate', 'Original Price', 'Stock', 'URL'])
-                
-                for platform, data in comparison.get('platforms', {}).items():
-                    writer.writerow([
+                # 행을 제너레이터로 만들어 writerows 한 번으로 기록합니다
+                writer.writerows(
+                    (
                         platform,
                         data.get('price', 0),
                         data.get('discount_rate', 0),
                         data.get('original_price', ''),
                         data.get('stock', 0),
                         data.get('url', '')
-                    ])
+                    )
+                    for platform, data in comparison.get('platforms', {}).items()
+                )
         
         logger.info(f"비교 결과 저장됨: {filepath}")
     
     def clear_results(self):
         """결과 목록을 초기화합니다."""
-        self.results.clear()
+        self._results.clear()
+        # 늘어난 수치 컬럼 버퍼도 초기 크기로 되돌려 메모리를 반환합니다
+        self._prices = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._discount_rates = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
         logger.info("결과 목록 초기화됨")
 
 
@@ -192,6 +304,29 @@ class DiscountCalculator:
         discount_rate = ((original_price - current_price) / original_price) * 100
         return round(discount_rate, 2)
     
+    @staticmethod
+    def calculate_discount_rate_bulk(current_prices: Any, original_prices: Any) -> np.ndarray:
+        """
+        여러 상품의 할인율을 한 번에 계산합니다.
+        
+        calculate_discount_rate 와 같은 규칙(원가가 0 이하이거나 현재 가격이
+        원가 이상이면 0)을 numpy 배열 연산으로 적용합니다.
+        
+        Args:
+            current_prices (Any): 현재 가격 배열 (array-like)
+            original_prices (Any): 원가 배열 (array-like)
+            
+        Returns:
+            np.ndarray: 할인율 배열 (%)
+        """
+        current = np.asarray(current_prices, dtype=np.float64)
+        original = np.asarray(original_prices, dtype=np.float64)
+        
+        valid = (original > 0) & (current < original)
+        rates = np.zeros(np.broadcast(current, original).shape, dtype=np.float64)
+        np.divide((original - current) * 100, original, out=rates, where=valid)
+        return np.round(rates, 2)
+    
     @staticmethod
     def calculate_savings_amount(current_price: float, original_price: float) -> float:
         """